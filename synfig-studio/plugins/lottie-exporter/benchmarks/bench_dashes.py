@@ -0,0 +1,96 @@
+# pylint: disable=line-too-long
+"""
+Benchmark for the dashes of advanced outlines. Exports a dashed advanced
+outline with the plugin of this tree and with the plugin of a baseline git
+revision, times the exports and tells whether the Lottie files are identical
+
+usage   : python3 bench_dashes.py --baseline REV [--runs N] [FILE_NAME.sif]
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+
+PLUGIN_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dashed_outline.sif")
+
+
+def extract_plugin(rev, dest):
+    """
+    Extracts the plugin as it was at a git revision
+
+    Args:
+        rev  (str) : Git revision
+        dest (str) : Directory to extract the plugin into
+
+    Returns:
+        (str) : Directory of the extracted plugin
+    """
+    top = subprocess.check_output(["git", "rev-parse", "--show-toplevel"], cwd=PLUGIN_DIR, universal_newlines=True).strip()
+    prefix = os.path.relpath(PLUGIN_DIR, top)
+    archive = subprocess.Popen(["git", "archive", rev, prefix], cwd=top, stdout=subprocess.PIPE)
+    subprocess.check_call(["tar", "-x", "-C", dest], stdin=archive.stdout)
+    archive.stdout.close()
+    if archive.wait() != 0:
+        raise RuntimeError("git archive failed for revision " + rev)
+    return os.path.join(dest, prefix)
+
+
+def time_export(plugin_dir, file_name, out_dir, runs):
+    """
+    Exports a file a number of times with a plugin
+
+    Args:
+        plugin_dir (str) : Directory of the plugin
+        file_name  (str) : Synfig file to export
+        out_dir    (str) : Directory of the Lottie file
+        runs       (int) : Number of exports
+
+    Returns:
+        (list) : Seconds taken by each export
+        (str)  : Path of the Lottie file
+    """
+    exporter = os.path.join(plugin_dir, "lottie-exporter.py")
+    out_file = os.path.join(out_dir, "out.json")
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, exporter, file_name, out_file], stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times, out_file
+
+
+def main():
+    """
+    Runs the benchmark and prints the timings
+    """
+    parser = argparse.ArgumentParser(description="Times the export of dashed advanced outlines")
+    parser.add_argument("infile", nargs="?", default=SAMPLE, help="Synfig file to export")
+    parser.add_argument("--baseline", required=True, help="Git revision to compare with, like a tag or HEAD~1")
+    parser.add_argument("--runs", type=int, default=3, help="Number of exports with each plugin")
+    args = parser.parse_args()
+    infile = os.path.abspath(args.infile)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        plugins = [(args.baseline, extract_plugin(args.baseline, tmp)), ("current", PLUGIN_DIR)]
+        outputs, best = [], []
+        for name, plugin_dir in plugins:
+            out_dir = os.path.join(tmp, "out_" + str(len(outputs)))
+            os.mkdir(out_dir)
+            times, out_file = time_export(plugin_dir, infile, out_dir, args.runs)
+            with open(out_file, "rb") as f:
+                outputs.append(f.read())
+            best.append(min(times))
+            print("%-12s best %.2fs, runs: %s" % (name, min(times), ", ".join("%.2f" % t for t in times)))
+
+    print("speedup      %.2fx" % (best[0] / best[1]))
+    identical = outputs[0] == outputs[1]
+    print("output       " + ("identical" if identical else "DIFFERENT"))
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,11 @@
 """
 This module converts the canvas to lottie format
 """
+import re
+import argparse
 import settings
 from common.misc import calculate_pixels_per_unit
+from synfig.group import set_precomp_size
 
 
 def convert_time_to_frames(time):
@@ -16,7 +19,7 @@ def convert_time_to_frames(time):
     Returns:
         (float)
     """
-    time = time.strip().split(" ")
+    time = time.split()
     ret = 0
     for frame in time:
         # Adding time in hours
@@ -35,9 +38,29 @@ def convert_time_to_frames(time):
     return ret
 
 
+def check_time(time):
+    """
+    Checks that a time given on the command line is in the Synfig time format:
+    numbers in hours, minutes, seconds or frames, separated by spaces
+
+    Args:
+        time (str) : Time in h/m/s/f, like "2s" or "1s 12f"
+
+    Returns:
+        (str) : The same time
+
+    Raises:
+        argparse.ArgumentTypeError : If the time is not in h/m/s/f
+    """
+    if not re.fullmatch(r"\s*([-+]?(\d+\.?\d*|\.\d+)[hmsf]\s*)+", time):
+        raise argparse.ArgumentTypeError("invalid time '%s', expected numbers followed by h, m, s or f, like 2s or 48f" % time)
+    return time
+
+
 def calc_time(root, lottie, which):
     """
-    Converts the starting time and ending time to lottie format
+    Converts the starting time and ending time to lottie format, unless they
+    are overridden in settings
 
     Args:
         root   (lxml.etree._Element) : Synfig format animation file
@@ -52,6 +75,10 @@ def calc_time(root, lottie, which):
     elif which == "op":
         phase = "end-time"
     time = root.attrib[phase]
+    if which == "ip" and settings.BEGIN_TIME is not None:
+        time = settings.BEGIN_TIME
+    elif which == "op" and settings.END_TIME is not None:
+        time = settings.END_TIME
     lottie[which] = convert_time_to_frames(time)
 
     # To support canvas with single frames
@@ -82,9 +109,6 @@ def gen_canvas(lottie, root):
     else:
         lottie["h"] = settings.DEFAULT_HEIGHT
 
-    settings.ADDITIONAL_PRECOMP_WIDTH = 4*lottie["w"]
-    settings.ADDITIONAL_PRECOMP_HEIGHT = 4*lottie["h"]
-
     # gamma correction values
     if "gamma-r" in root.attrib.keys():
         settings.GAMMA[0] = float(root.attrib["gamma-r"])
@@ -92,6 +116,7 @@ def gen_canvas(lottie, root):
         settings.GAMMA[1] = float(root.attrib["gamma-g"])
     if "gamma-b" in root.attrib.keys():
         settings.GAMMA[2] = float(root.attrib["gamma-b"])
+    settings.gamma_exponents = [1/gamma for gamma in settings.GAMMA]
 
     name = settings.DEFAULT_NAME
     for child in root:
@@ -102,8 +127,14 @@ def gen_canvas(lottie, root):
     lottie["ddd"] = settings.DEFAULT_3D
     lottie["v"] = settings.LOTTIE_VERSION
     lottie["fr"] = float(root.attrib["fps"])
+    if settings.FPS is not None:
+        lottie["fr"] = float(settings.FPS)
     lottie["assets"] = []       # Creating array for storing assets
     lottie["markers"] = []      # Creating array for storing markers
     calc_time(root, lottie, "ip")
     calc_time(root, lottie, "op")
+    # A canvas can have a single frame, but an overridden range must not be empty
+    if (settings.BEGIN_TIME is not None or settings.END_TIME is not None) and lottie["ip"] >= lottie["op"] - 1:
+        raise ValueError("The begin time of the exported range must be before its end time")
     calculate_pixels_per_unit()
+    set_precomp_size(root)
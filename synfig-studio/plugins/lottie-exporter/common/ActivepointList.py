@@ -7,6 +7,7 @@ https://github.com/synfig/synfig/blob/15607089680af560ad031465d31878425af927eb/s
 """
 
 import sys
+import bisect
 import settings
 from common.Activepoint import Activepoint
 sys.path.append("..")
@@ -18,6 +19,8 @@ class ActivepointList:
     """
     def __init__(self, on_time, off_time):
         self.active_point_list = []
+        self.times = []     # Sorted times of the active points, for bisecting
+        self.amounts = {}   # Amount(and state of the next point while rising/falling) at frames
         if on_time is None and off_time is None:
             return
 
@@ -35,6 +38,7 @@ class ActivepointList:
         # Removing duplicates
         self.active_point_list = self.remove_duplicates()
         self.active_point_list = sorted(self.active_point_list)
+        self.times = [itr.time for itr in self.active_point_list]
 
     def remove_duplicates(self):
         """
@@ -53,71 +57,77 @@ class ActivepointList:
     def find(self, frame):
         """
         https://github.com/synfig/synfig/blob/15607089680af560ad031465d31878425af927eb/synfig-core/src/synfig/valuenodes/valuenode_dynamiclist.cpp#L268
-        """
-        for itr in self.active_point_list:
-            if itr.time == frame:
-                return itr
 
-        raise Exception("Value not found")
+        Returns:
+            (common.Activepoint.Activepoint | None) : Active point at frame, None if there is none
+        """
+        itr = bisect.bisect_left(self.times, frame)
+        if itr != len(self.times) and self.times[itr] == frame:
+            return self.active_point_list[itr]
+        return None
 
     def find_prev(self, frame):
         """
         https://github.com/synfig/synfig/blob/15607089680af560ad031465d31878425af927eb/synfig-core/src/synfig/valuenodes/valuenode_dynamiclist.cpp#L324
-        """
-        itr = len(self.active_point_list)
 
-        while True:
-            itr -= 1
-            if self.active_point_list[itr].time < frame:
-                return self.active_point_list[itr]
-
-            if not (itr != 0):
-                break
-
-        raise Exception("Could not find prev")
+        Returns:
+            (common.Activepoint.Activepoint | None) : Last active point before frame, None if there is none
+        """
+        itr = bisect.bisect_left(self.times, frame)
+        if itr == 0:
+            return None
+        return self.active_point_list[itr - 1]
 
     def find_next(self, frame):
         """
         https://github.com/synfig/synfig/blob/15607089680af560ad031465d31878425af927eb/synfig-core/src/synfig/valuenodes/valuenode_dynamiclist.cpp#L296
-        """
-        for itr in self.active_point_list:
-            if itr.time > frame:
-                return itr
 
-        raise Exception("Could not find next")
+        Returns:
+            (common.Activepoint.Activepoint | None) : First active point after frame, None if there is none
+        """
+        itr = bisect.bisect_right(self.times, frame)
+        if itr == len(self.times):
+            return None
+        return self.active_point_list[itr]
 
     def amount_at_time(self, frame, rising = None):
         """
         https://github.com/synfig/synfig/blob/15607089680af560ad031465d31878425af927eb/synfig-core/src/synfig/valuenodes/valuenode_dynamiclist.cpp#L394
+
+        The amounts are calculated once per frame and stored
+        """
+        if frame not in self.amounts:
+            self.amounts[frame] = self.calc_amount_at_time(frame)
+        amount, state = self.amounts[frame]
+        if rising is not None and state is not None:
+            rising[0] = state
+        return amount
+
+    def calc_amount_at_time(self, frame):
+        """
+        Returns the amount at frame, and the state of the next active point
+        if the point is being turned on/off at frame(None otherwise)
         """
         if self.empty():
-            return 1
-
-        try:
-            itr = self.find(frame)
-            return 1 if itr.state else 0
-        except Exception as e:
-            pass
+            return 1, None
 
-        try:
-            prev_itr = self.find_prev(frame)
-        except Exception as e:
-            return 1 if self.find_next(frame).state else 0
+        itr = self.find(frame)
+        if itr is not None:
+            return (1 if itr.state else 0), None
 
-        try:
-            next_itr = self.find_next(frame)
-        except Exception as e:
-            return 1 if prev_itr.state else 0
+        prev_itr = self.find_prev(frame)
+        next_itr = self.find_next(frame)
+        if prev_itr is None:
+            return (1 if next_itr.state else 0), None
+        if next_itr is None:
+            return (1 if prev_itr.state else 0), None
 
         if next_itr.state == prev_itr.state:
-            return 1 if next_itr.state else 0 
-
-        if rising is not None:
-            rising[0] = next_itr.state
+            return (1 if next_itr.state else 0), None
 
         if next_itr.state == True:
-            return float((frame - prev_itr.time)/(next_itr.time - prev_itr.time))
-        return float((next_itr.time - frame)/(next_itr.time - prev_itr.time))
+            return float((frame - prev_itr.time)/(next_itr.time - prev_itr.time)), next_itr.state
+        return float((next_itr.time - frame)/(next_itr.time - prev_itr.time)), next_itr.state
 
     def status_at_time(self, t):
         """
@@ -128,13 +138,9 @@ class ActivepointList:
             if len(self.active_point_list) == 1:
                 state = self.active_point_list[0].state
             else:
-                entry_itr = 0
-                while entry_itr != len(self.active_point_list):
-                    if self.active_point_list[entry_itr].time == t:
-                        return self.active_point_list[entry_itr].state
-                    if self.active_point_list[entry_itr].time > t:
-                        break
-                    entry_itr += 1
+                entry_itr = bisect.bisect_left(self.times, t)
+                if entry_itr != len(self.times) and self.times[entry_itr] == t:
+                    return self.active_point_list[entry_itr].state
                 prev_itr = entry_itr
                 prev_itr -= 1
 
@@ -5,6 +5,8 @@ Will store the Parameters class for Bline
 
 import sys
 import copy
+import hashlib
+from lxml import etree
 import common
 import settings
 from common.BlinePoint import BlinePoint
@@ -30,6 +32,7 @@ class Bline:
         self.type = bline.attrib["type"]
         self.entry_list = []
         self.extract_entries(self.entry_list)
+        self.key = None     # Identifies the animation of this bline, see get_list_at_frame()
 
     def get(self):
         """
@@ -152,7 +155,33 @@ class Bline:
 
     def get_list_at_frame(self, fr):
         """
-        Returns the Bline list at a particular frame
+        Returns the Bline list at a particular frame. The list is generated
+        only once per frame and shared with the next blines with the same
+        animation(like a region and the outline linked to it), each caller
+        gets its own copy of the points
+
+        Args:
+            fr (float) : Frame at which the list is required
+
+        Returns:
+            (list[common.BlinePoint.BlinePoint]) : Bline points at the frame
+        """
+        # The layers modify their copy of a linked bline(offsets inside
+        # precomps, axis conversion...), so it is identified by its final xml
+        if self.key is None:
+            self.key = hashlib.sha1(etree.tostring(self.bline)).digest()
+        # The layers are sampled one after the other, so the lists of the
+        # previous bline are no longer needed
+        if settings.bline_lists["key"] != self.key:
+            settings.bline_lists = {"key": self.key, "frames": {}}
+        frames = settings.bline_lists["frames"]
+        if fr not in frames:
+            frames[fr] = self.gen_list_at_frame(fr)
+        return [point.copy() for point in frames[fr]]
+
+    def gen_list_at_frame(self, fr):
+        """
+        Generates the Bline list at a particular frame
         Refer: https://github.com/synfig/synfig/blob/15607089680af560ad031465d31878425af927eb/synfig-core/src/synfig/valuenodes/valuenode_bline.cpp
         """
         EPSILON = 0.0000001
@@ -160,9 +189,17 @@ class Bline:
         first_flag = True
         rising = [False]
         next_scale = 1.0
+        points = {}     # Points looked up at other times, only read
+
+        def get_point(current, t):
+            if (current, t) not in points:
+                points[(current, t)] = self.get_blinepoint(current, t)
+            return points[(current, t)]
 
-        first = BlinePoint(Vector(0, 0), 1, True, False, Vector(0, 0), Vector(0, 0))
-        first.set_origin(100)
+        # Only the tangent2 and origin of the previous point are needed, they
+        # are stored before the point is changed inside ret_list
+        prev_tangent2 = Vector(0, 0)
+        prev_origin = 0
 
         iterr = 0
         while iterr != self.get_len():
@@ -173,26 +210,22 @@ class Bline:
 
             # It's fully on
             if amount > 1.0 - EPSILON:
+                curr = self.get_blinepoint(iterr, fr)
+                curr_tangent2 = curr.get_tangent2()
+                curr_origin = curr.get_origin()
                 if first_flag:
                     first_iter = iterr
-                    first = prev = self.get_blinepoint(iterr, fr)
                     first_flag = False
-                    ret_list.append(copy.deepcopy(first))
-                    iterr += 1
-                    continue
-                curr = self.get_blinepoint(iterr, fr)
-
-                if next_scale != 1.0:
-                    ret_list[-1].set_split_tangent_both(True)
-                    ret_list[-1].set_tangent2(prev.get_tangent2()*next_scale)
-                    ret_list.append(copy.deepcopy(curr))
+                elif next_scale != 1.0:
                     ret_list[-1].set_split_tangent_both(True)
-                    ret_list[-1].set_tangent2(curr.get_tangent2())
-                    ret_list[-1].set_tangent1(curr.get_tangent1()*next_scale)
+                    ret_list[-1].set_tangent2(prev_tangent2*next_scale)
+                    curr_tangent1 = curr.get_tangent1()
+                    curr.set_split_tangent_both(True)
+                    curr.set_tangent2(copy.copy(curr_tangent2))
+                    curr.set_tangent1(curr_tangent1*next_scale)
                     next_scale = 1.0
-                else:
-                    ret_list.append(copy.deepcopy(curr))
-                prev = curr
+                ret_list.append(curr)
+                prev_tangent2, prev_origin = curr_tangent2, curr_origin
 
             # It's partly on
             elif amount > 0.0:
@@ -202,26 +235,16 @@ class Bline:
                 dist_from_begin = 0
                 dist_from_end = 0
 
+                prev_itr = entry["ActivepointList"].find_prev(fr)
+                prev_time = settings.SOT if prev_itr is None else prev_itr.get_time()
+                next_itr = entry["ActivepointList"].find_next(fr)
+                next_time = settings.EOT if next_itr is None else next_itr.get_time()
                 if not rising[0]:
-                    try:
-                        on_time = self.get_entry_list()[iterr]["ActivepointList"].find_prev(fr).get_time()
-                    except Exception as e:
-                        on_time = settings.SOT
-                    try:
-                        off_time = self.get_entry_list()[iterr]["ActivepointList"].find_next(fr).get_time()
-                    except Exception as e:
-                        off_time = settings.EOT
+                    on_time, off_time = prev_time, next_time
                 else:
-                    try:
-                        off_time = self.get_entry_list()[iterr]["ActivepointList"].find_prev(fr).get_time()
-                    except Exception as e:
-                        off_time = settings.SOT
-                    try:
-                        on_time = self.get_entry_list()[iterr]["ActivepointList"].find_next(fr).get_time()
-                    except Exception as e:
-                        on_time = settings.EOT
-
-                blp_here_on = self.get_blinepoint(iterr, on_time)
+                    off_time, on_time = prev_time, next_time
+
+                blp_here_on = get_point(iterr, on_time)
                 end_iter = iterr
 
                 end_iter += 1
@@ -236,7 +259,7 @@ class Bline:
                     else:
                         end_iter = self.get_len() - 1
 
-                blp_next_off = self.get_blinepoint(end_iter, off_time)
+                blp_next_off = get_point(end_iter, off_time)
 
                 begin_iter = iterr
                 blp_prev_off.set_origin(100)
@@ -254,7 +277,7 @@ class Bline:
                         break
 
                     if self.get_entry_list()[begin_iter]["ActivepointList"].amount_at_time(fr) > amount:
-                        blp_prev_off = self.get_blinepoint(begin_iter, off_time)
+                        blp_prev_off = get_point(begin_iter, off_time)
                         break
 
                 if blp_prev_off.get_origin() == 100:
@@ -262,7 +285,7 @@ class Bline:
                         begin_iter = 0
                     else:
                         begin_iter = first_iter
-                    blp_prev_off = self.get_blinepoint(begin_iter, off_time)
+                    blp_prev_off = get_point(begin_iter, off_time)
 
                 curve = Hermite(blp_prev_off.get_vertex(),
                                 blp_next_off.get_vertex(),
@@ -277,12 +300,12 @@ class Bline:
                 if begin_iter == (iterr - 1) or dist_from_begin == 1:
                     prev_tangent_scalar = self.linear_interpolation(blp_here_on.get_origin(), 1.0, amount)
                 else:
-                    prev_tangent_scalar = self.linear_interpolation(blp_here_on.get_origin()-prev.get_origin(), 1.0, amount)
+                    prev_tangent_scalar = self.linear_interpolation(blp_here_on.get_origin()-prev_origin, 1.0, amount)
 
                 if end_iter == (iterr + 1) or dist_from_end == 1:
                     next_tangent_scalar= self.linear_interpolation(1.0-blp_here_on.get_origin(), 1.0, amount)
                 elif self.get_len() != (iterr + 1):
-                    nextt = self.get_blinepoint(iterr+1, fr)
+                    nextt = get_point(iterr+1, fr)
                     next_tangent_scalar = self.linear_interpolation(nextt.get_origin()-blp_here_on.get_origin(), 1.0, amount)
                 else:
                     next_tangent_scalar = self.linear_interpolation(blp_next_off.get_origin()-blp_here_on.get_origin(), 1.0, amount)
@@ -292,20 +315,20 @@ class Bline:
                 off_coord_sys = []
                 on_coord_sys = []
                 curr_coord_sys = []
-                end_pos_at_off_time = self.get_blinepoint(end_iter, off_time).get_vertex()
-                begin_pos_at_off_time = self.get_blinepoint(begin_iter, off_time).get_vertex()
+                end_pos_at_off_time = get_point(end_iter, off_time).get_vertex()
+                begin_pos_at_off_time = get_point(begin_iter, off_time).get_vertex()
                 off_coord_origin = (begin_pos_at_off_time + end_pos_at_off_time)/2
                 off_coord_sys.append((begin_pos_at_off_time - end_pos_at_off_time).norm())
                 off_coord_sys.append(off_coord_sys[0].perp())
 
-                end_pos_at_on_time = self.get_blinepoint(end_iter, on_time).get_vertex()
-                begin_pos_at_on_time = self.get_blinepoint(begin_iter, on_time).get_vertex()
+                end_pos_at_on_time = get_point(end_iter, on_time).get_vertex()
+                begin_pos_at_on_time = get_point(begin_iter, on_time).get_vertex()
                 on_coord_origin = (begin_pos_at_on_time + end_pos_at_on_time)/2
                 on_coord_sys.append((begin_pos_at_on_time - end_pos_at_on_time).norm())
                 on_coord_sys.append(on_coord_sys[0].perp())
 
-                end_pos_at_current_time = self.get_blinepoint(end_iter, fr).get_vertex()
-                begin_pos_at_current_time = self.get_blinepoint(begin_iter, fr).get_vertex()
+                end_pos_at_current_time = get_point(end_iter, fr).get_vertex()
+                begin_pos_at_current_time = get_point(begin_iter, fr).get_vertex()
                 curr_coord_origin = (begin_pos_at_current_time + end_pos_at_current_time)/2
                 curr_coord_sys.append((begin_pos_at_current_time - end_pos_at_current_time).norm())
                 curr_coord_sys.append(curr_coord_sys[0].perp())
@@ -356,25 +379,26 @@ class Bline:
                 if first_flag:
                     blp_here_now.set_tangent1(blp_here_now.get_tangent1()*prev_tangent_scalar)
                     first_iter = iterr
-                    first = prev = blp_here_now
                     first_flag = False
-                    ret_list.append(copy.deepcopy(blp_here_now))
+                    prev_tangent2, prev_origin = blp_here_now.get_tangent2(), blp_here_now.get_origin()
+                    ret_list.append(blp_here_now)
                     iterr += 1
                     continue
 
                 ret_list[-1].set_split_tangent_both(True)
-                ret_list[-1].set_tangent2(prev.get_tangent2()*prev_tangent_scalar)
+                ret_list[-1].set_tangent2(prev_tangent2*prev_tangent_scalar)
 
-                ret_list.append(copy.deepcopy(blp_here_now))
-                ret_list[-1].set_split_tangent_both(True)
-                ret_list[-1].set_tangent1(blp_here_now.get_tangent1()*prev_tangent_scalar)
-                prev = blp_here_now
+                curr_tangent2, curr_origin = blp_here_now.get_tangent2(), blp_here_now.get_origin()
+                blp_here_now.set_split_tangent_both(True)
+                blp_here_now.set_tangent1(blp_here_now.get_tangent1()*prev_tangent_scalar)
+                ret_list.append(blp_here_now)
+                prev_tangent2, prev_origin = curr_tangent2, curr_origin
 
             iterr += 1
 
         if next_scale != 1:
             ret_list[-1].set_split_tangent_both(True)
-            ret_list[-1].set_tangent2(prev.get_tangent2()*next_scale)
+            ret_list[-1].set_tangent2(prev_tangent2*next_scale)
 
         return ret_list
 
@@ -7,6 +7,7 @@ https://github.com/synfig/synfig/blob/15607089680af560ad031465d31878425af927eb/s
 """
 
 import sys
+import copy
 from common.Vector import Vector
 sys.path.append("..")
 
@@ -32,6 +33,25 @@ class BlinePoint:
         self.update_flags()
         self.update_tangent2()
 
+    def copy(self):
+        """
+        Returns a copy of this point, with its own vectors so that they can be
+        modified in place without changing this point. Much cheaper than
+        copy.deepcopy()
+        """
+        ret = copy.copy(self)
+        copies = {}
+        def dup(vector):
+            if id(vector) not in copies:
+                copies[id(vector)] = copy.copy(vector)
+            return copies[id(vector)]
+        ret.vertex_ = dup(self.vertex_)
+        ret.vertex_setup_ = dup(self.vertex_setup_)
+        ret.tangent_ = [dup(self.tangent_[0]), dup(self.tangent_[1])]
+        ret.tangent2_radius_split_ = dup(self.tangent2_radius_split_)
+        ret.tangent2_angle_split_ = dup(self.tangent2_angle_split_)
+        return ret
+
     def update_flags(self):
         self.split_tangent_both_ = self.split_tangent_radius_ and self.split_tangent_angle_
         self.merge_tangent_both_ = (not self.split_tangent_radius_) and (not self.split_tangent_angle_)
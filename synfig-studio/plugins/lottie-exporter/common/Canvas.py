@@ -26,6 +26,7 @@ class Canvas:
             self.parent_param = canvas
         else:
             self.canvas = canvas
+            self.parent_param = None
         self.defs = {}
         self.extract_defs(self.defs)
 
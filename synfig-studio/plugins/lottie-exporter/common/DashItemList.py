@@ -24,6 +24,7 @@ class DashItemList:
         self.type = dash_item.attrib["type"]
         self.entry_list = []
         self.extract_entries(self.entry_list)
+        self.lists = {}     # Dash items at each frame
 
     def get(self):
         """
@@ -114,7 +115,17 @@ class DashItemList:
 
     def get_list_at_frame(self, fr):
         """
-        Returns list of Dashitems at a particular frame
+        Returns list of Dashitems at a particular frame. The list is computed
+        once per frame(every frame is needed as "s" and as "e" value), so the
+        Dashitems are shared and must not be modified
+        """
+        if fr not in self.lists:
+            self.lists[fr] = self.gen_list_at_frame(fr)
+        return list(self.lists[fr])
+
+    def gen_list_at_frame(self, fr):
+        """
+        Generates list of Dashitems at a particular frame
         Refer:  https://github.com/synfig/synfig/blob/15607089680af560ad031465d31878425af927eb/synfig-core/src/synfig/valuenodes/valuenode_dilist.cpp#L129
         """
         dilist = []
@@ -7,7 +7,6 @@ import sys
 import copy
 import math
 import common
-import settings
 from common.Color import Color
 sys.path.append("..")
 
@@ -36,9 +35,9 @@ class Gradient:
         """
         initial_list = []
         for col in self.synfig_gradient:
-            red = float(col[0].text) ** (1/settings.GAMMA[0])
-            green = float(col[1].text) ** (1/settings.GAMMA[1])
-            blue = float(col[2].text) ** (1/settings.GAMMA[2])
+            red = common.misc.gamma_correct(float(col[0].text), 0)
+            green = common.misc.gamma_correct(float(col[1].text), 1)
+            blue = common.misc.gamma_correct(float(col[2].text), 2)
             alpha = float(col[3].text)
             initial_list.append([float(col.attrib["pos"]), Color(red, green, blue, alpha)]) 
         self.colors = initial_list
@@ -53,11 +52,10 @@ class Gradient:
         Returns:
             (common.Color.Color) : color element with gamma effect reversed
         """
-        ret = copy.deepcopy(color)
-        ret.red = ret.red ** settings.GAMMA[0]
-        ret.green = ret.green ** settings.GAMMA[1]
-        ret.blue = ret.blue ** settings.GAMMA[2]
-        return ret
+        red = common.misc.reverse_gamma_correct(color.red, 0)
+        green = common.misc.reverse_gamma_correct(color.green, 1)
+        blue = common.misc.reverse_gamma_correct(color.blue, 2)
+        return Color(red, green, blue, color.alpha)
 
     def get_lottie_final_list(self):
         """
@@ -156,6 +154,48 @@ class Gradient:
         col = self.blend(self.reverse_gamma(self.colors[i][1]), self.reverse_gamma(self.colors[j][1]), amount)
         return col
 
+    def get_colors_at(self, positions):
+        """
+        Returns the colors at many positions, same as calling get_color_at_x()
+        for each of them. The positions are sorted, so the colors of the
+        gradient are swept once instead of being searched for each position
+
+        Args:
+            positions (list) : Sorted positions at which the colors are needed
+
+        Returns:
+            (list) : common.Color.Color at each of the positions
+        """
+        if len(self.colors) == 0:
+            return [Color() for x in positions]
+
+        # Gamma is reversed once for every color of the gradient
+        colors = [self.reverse_gamma(col[1]) for col in self.colors]
+        precision = common.misc.real_high_precision()
+        ret = []
+        upper = 0
+        for x in positions:
+            if len(self.colors) == 1 or math.isnan(x) or x <= self.colors[0][0]:
+                ret.append(colors[0])
+                continue
+            if x >= self.colors[-1][0]:
+                ret.append(colors[-1])
+                continue
+
+            # upper bound, it only moves forward as the positions are sorted
+            while upper < len(self.colors) - 1 and not self.comp(x, self.colors[upper][0]):
+                upper += 1
+            j = upper
+            i = j - 1
+            d = self.colors[j][0] - self.colors[i][0]
+            if d <= precision:
+                ret.append(colors[i])
+                continue
+
+            amount = (x - self.colors[i][0]) / d
+            ret.append(self.blend(colors[i], colors[j], amount))
+        return ret
+
     def blend(self, col1, col2, amount):
         """
         https://github.com/synfig/synfig/blob/ae11655a9bba068543be7a5df9090958579de78e/synfig-core/src/synfig/gradient.cpp#L200
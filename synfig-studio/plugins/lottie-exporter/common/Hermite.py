@@ -55,6 +55,16 @@ class Hermite:
         self.coeff2 = self.c*3 - self.b*6 + self.a*3
         self.coeff3 = self.d - self.c*3 + self.b*3 - self.a
 
+        # Components of the coefficients, used by find_distance() to avoid
+        # creating a Vector at every step
+        coeffs = (self.coeff0, self.coeff1, self.coeff2, self.coeff3)
+        if hasattr(self.coeff0, "val1"):
+            self.coeffs_x = tuple(coeff.val1 for coeff in coeffs)
+            self.coeffs_y = tuple(coeff.val2 for coeff in coeffs)
+        else:
+            self.coeffs_x = coeffs
+            self.coeffs_y = (0.0, 0.0, 0.0, 0.0)
+
     def derivative(self, x):
         """
         Calculates the derivative of the curve at x
@@ -98,16 +108,30 @@ class Hermite:
             return 0
         ret = 0.0
 
-        last = self.single_operator(r)
+        # Same as single_operator(), double_operator() and uncook(), but on
+        # the components
+        c0x, c1x, c2x, c3x = self.coeffs_x
+        c0y, c1y, c2y, c3y = self.coeffs_y
+        start, drs = self.r, self.drs
+
+        t = (r - start) * drs
+        last_x = c0x + (c1x + (c2x + c3x*t)*t)*t
+        last_y = c0y + (c1y + (c2y + c3y*t)*t)*t
 
         r += inc
         while r < s:
-            n = self.single_operator(r)
-            ret += self.uncook(self.double_operator(last, n))
-            last = n
+            t = (r - start) * drs
+            n_x = c0x + (c1x + (c2x + c3x*t)*t)*t
+            n_y = c0y + (c1y + (c2y + c3y*t)*t)*t
+            delta_x, delta_y = n_x - last_x, n_y - last_y
+            ret += math.sqrt(delta_x*delta_x + delta_y*delta_y)
+            last_x, last_y = n_x, n_y
             r += inc
 
-        ret += self.uncook(self.double_operator(last, self.single_operator(r)))*(s-(r-inc))/inc
+        t = (r - start) * drs
+        delta_x = c0x + (c1x + (c2x + c3x*t)*t)*t - last_x
+        delta_y = c0y + (c1y + (c2y + c3y*t)*t)*t - last_y
+        ret += math.sqrt(delta_x*delta_x + delta_y*delta_y)*(s-(r-inc))/inc
         return ret
 
     def single_operator(self, t):
@@ -1195,7 +1195,8 @@ class Param:
     def update_frame_window(self, window):
         """
         Given an animation, find the minimum and maximum frame at which the
-        waypoints are located
+        waypoints are located. If window has a "waypoints" set, the frames of
+        all the waypoints are added to it
         """
         self.extract_subparams()
         if self.param.tag in {"bone", "bone_root"}:
@@ -1344,6 +1345,8 @@ class Param:
             for waypoint in node:
                 fr = common.misc.get_frame(waypoint)
                 settings.WAYPOINTS_LIST.append(fr)
+                if "waypoints" in window:
+                    window["waypoints"].add(fr)
                 if fr > window["last"]:
                     window["last"] = fr
                 if fr < window["first"]:
@@ -7,6 +7,7 @@ https://github.com/synfig/synfig/blob/15607089680af560ad031465d31878425af927eb/s
 """
 
 import sys
+import copy
 import math
 from functools import total_ordering
 sys.path.append("..")
@@ -29,6 +30,14 @@ class WidthPoint:
         self.lower_bound_ = lower_bound
         self.upper_bound_ = upper_bound
 
+    def copy(self):
+        """
+        Returns a copy of this width point, cheaper than copy.deepcopy()
+        """
+        ret = copy.copy(self)
+        ret.side_type_ = list(self.side_type_)
+        return ret
+
     def set_position(self, x):
         self.position_ = x
 
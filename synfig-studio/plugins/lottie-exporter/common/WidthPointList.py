@@ -4,6 +4,7 @@ Will store the Parameters class for Width point list
 """
 
 import sys
+import bisect
 import common
 import properties.shapePropKeyframe as advanced_outline
 from synfig.animation import to_Synfig_axis
@@ -167,6 +168,7 @@ class WidthPointList:
         """
         wplist = []
         rising = [False]
+        index = None
 
         for entry in self.get_entry_list():
             amount = entry["ActivepointList"].amount_at_time(fr, rising)
@@ -183,53 +185,74 @@ class WidthPointList:
                 # This is where the interesting stuff happens
                 # on_time, and off_time are never needed, so why bother writing
                 # them?
+                if index is None:
+                    index = self.get_index_at_frame(fr)
 
-                i_width = self.interpolated_width(curr.get_norm_position(self.get_loop()), fr)
+                i_width = self.interpolated_width(curr.get_norm_position(self.get_loop()), fr, index)
                 curr_width = curr.get_width()
 
                 curr.set_width(i_width*(1.0-amount)+(curr_width)*amount)
                 wplist.append(curr)
         return wplist
 
-    def interpolated_width(self, position, time):
-        prev = self.find_prev_valid_entry_by_position(position, time)
-        neext = self.find_next_valid_entry_by_position(position, time)
+    def get_index_at_frame(self, fr):
+        """
+        Evaluates every width point once at a frame, and sorts the ones which
+        are on by their normalised position, so that the neighbours of a
+        position can be binary searched
+
+        Args:
+            fr (float) : Frame at which the width points are evaluated
+
+        Returns:
+            (dict) : "positions" sorted normalised positions, "points" the corresponding width points
+        """
+        valid = []
+        for itr, entry in enumerate(self.get_entry_list()):
+            if entry["ActivepointList"].status_at_time(fr):
+                curr = self.get_value_at_frame(entry, fr)
+                valid.append((curr.get_norm_position(self.get_loop()), itr, curr))
+        # Equal positions keep the order of the entries
+        valid.sort(key=lambda x: (x[0], x[1]))
+        return {"positions": [x[0] for x in valid], "points": [x[2] for x in valid]}
+
+    def interpolated_width(self, position, time, index=None):
+        if index is None:
+            index = self.get_index_at_frame(time)
+        prev = self.find_prev_valid_entry_by_position(position, time, index)
+        neext = self.find_next_valid_entry_by_position(position, time, index)
         prev.normalize(self.get_loop())
         neext.normalize(self.get_loop())
         return advanced_outline.advanced_outline.widthpoint_interpolate(prev, neext, position)
 
-    def find_prev_valid_entry_by_position(self, position, time):
-        prev_pos = -123456
-        prev_ret = common.WidthPoint.WidthPoint(prev_pos, 0.0, 0, 0, False)
-        if len(self.get_entry_list()) == 0:
-            return prev_ret
-        for entry in self.get_entry_list():
-            curr = self.get_value_at_frame(entry, time)
-            curr_pos = curr.get_norm_position(self.get_loop())
-
-            status = entry["ActivepointList"].status_at_time(time)
-            if (curr_pos < position) and (curr_pos > prev_pos) and status:
-                prev_pos = curr_pos
-                prev_ret = curr
+    def find_prev_valid_entry_by_position(self, position, time, index=None):
+        if index is None:
+            index = self.get_index_at_frame(time)
+        positions = index["positions"]
 
-        if prev_ret.get_position() == -123456:
-            if self.bline_loop:
-                prev_ret = self.find_prev_valid_entry_by_position(2.0, time)
-            else:
-                prev_ret = self.find_next_valid_entry_by_position(-1.0, time)
-                prev_ret.set_position(0.0)
+        # Last valid width point before position, the first entry among equals
+        itr = bisect.bisect_left(positions, position)
+        if itr != 0:
+            itr = bisect.bisect_left(positions, positions[itr-1])
+            return index["points"][itr].copy()
 
+        if len(self.get_entry_list()) == 0:
+            return common.WidthPoint.WidthPoint(-123456, 0.0, 0, 0, False)
+        if self.bline_loop:
+            if len(positions) == 0:     # No width point is on
+                return common.WidthPoint.WidthPoint(-123456, 0.0, 0, 0, False)
+            return self.find_prev_valid_entry_by_position(2.0, time, index)
+        prev_ret = self.find_next_valid_entry_by_position(-1.0, time, index)
+        prev_ret.set_position(0.0)
         return prev_ret
 
-    def find_next_valid_entry_by_position(self, position, time):
-        next_pos = 1.0
-        next_ret = common.WidthPoint.WidthPoint(next_pos, 0.0, 0, 0, False)
+    def find_next_valid_entry_by_position(self, position, time, index=None):
+        if index is None:
+            index = self.get_index_at_frame(time)
+        positions = index["positions"]
 
-        for entry in self.get_entry_list():
-            curr = self.get_value_at_frame(entry, time)
-            curr_pos = curr.get_norm_position(self.get_loop())
-            status = entry["ActivepointList"].status_at_time(time)
-            if (curr_pos > position) and (curr_pos < next_pos) and status:
-                next_pos = curr_pos
-                next_ret = curr
-        return next_ret
+        # First valid width point after position, before 1.0
+        itr = bisect.bisect_right(positions, position)
+        if itr != len(positions) and positions[itr] < 1.0:
+            return index["points"][itr].copy()
+        return common.WidthPoint.WidthPoint(1.0, 0.0, 0, 0, False)
@@ -191,9 +191,9 @@ def parse_position(animated, i):
         green = float(animated[i][0][1].text)
         blue = float(animated[i][0][2].text)
         alpha = float(animated[i][0][3].text)
-        red = red ** (1/settings.GAMMA[0])
-        green = green ** (1/settings.GAMMA[1])
-        blue = blue ** (1/settings.GAMMA[2])
+        red = gamma_correct(red, 0)
+        green = gamma_correct(green, 1)
+        blue = gamma_correct(blue, 2)
         return Color(red, green, blue, alpha)
     
     elif animated.attrib["type"] == "gradient":
@@ -264,18 +264,47 @@ def is_animated(node):
     return case
 
 
-def clamp_col(color, gamma):
+def gamma_correct(color, channel):
+    """
+    Applies the gamma correction of a color channel to a color value
+
+    Args:
+        color   (float) : Synfig format color value
+        channel (int)   : 0, 1 or 2 for the red, green or blue channel
+
+    Returns:
+        (float) : color ** (1/gamma)
+    """
+    return color ** settings.gamma_exponents[channel]
+
+
+def reverse_gamma_correct(color, channel):
+    """
+    Reverses the effect of gamma_correct() on a color value
+
+    Args:
+        color   (float) : Gamma corrected color value
+        channel (int)   : 0, 1 or 2 for the red, green or blue channel
+
+    Returns:
+        (float) : color ** gamma
+    """
+    return color ** settings.GAMMA[channel]
+
+
+def clamp_col(color, channel):
     """
     This function converts the colors into int and takes them to the range of
     0-255
 
     Args:
-        color (float) : Synfig format color value
+        color   (float) : Synfig format color value
+        channel (int)   : 0, 1 or 2 for the red, green or blue channel
 
     Returns:
         (int) : Color value between 0-255
     """
-    color = color ** (1/gamma)
+    color = gamma_correct(color, channel)
     color *= 255
     color = int(color)
     return max(0, min(color, 255))
@@ -300,7 +329,7 @@ def get_color_hex(node):
         elif col.tag == "b":
             blue = float(col.text)
     # Convert to 0-255 range
-    red, green, blue = clamp_col(red, settings.GAMMA[0]), clamp_col(green, settings.GAMMA[1]), clamp_col(blue, settings.GAMMA[2])
+    red, green, blue = clamp_col(red, 0), clamp_col(green, 1), clamp_col(blue, 2)
 
     # https://stackoverflow.com/questions/3380726/converting-a-rgb-color-tuple-to-a-six-digit-code-in-python/3380739#3380739
     ret = "#{0:02x}{1:02x}{2:02x}".format(red, green, blue)
@@ -323,6 +352,31 @@ def get_frame(waypoint):
     return frame
 
 
+def clip_frame_window(window):
+    """
+    Clips the frame window of a sampled animation to the exported frames.
+    Waypoints outside of them can widen the window, but the frames before the
+    first exported frame are never shown, and after the last one only the
+    frame following it is needed for the interpolation. Even inside time
+    remapped groups, the frames stay inside this range. An empty window is
+    reduced to the first exported frame
+
+    Args:
+        window (dict) : First and last frame of the animation
+
+    Returns:
+        (None)
+    """
+    first, last = window["first"], window["last"]
+    if first == sys.maxsize and last == -1:
+        first = last = 0
+    ip = math.ceil(settings.lottie_format["ip"])
+    op = math.floor(settings.lottie_format["op"])
+    window["first"] = min(max(first, ip), op)
+    window["last"] = max(min(last, op), window["first"])
+    settings.skipped_frames += (last - first) - (window["last"] - window["first"])
+
+
 def get_time(waypoint):
     """
     Given a waypoint, it parses the string time to float time
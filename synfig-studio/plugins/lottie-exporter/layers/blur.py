@@ -3,7 +3,10 @@
 Will store all the functions corresponding to Blur Layer in lottie
 """
 
+from lxml import etree
 import settings
+from common.Param import Param
+from helpers.transform import gen_helpers_transform
 from properties.valueKeyframed import gen_value_Keyframed
 from common.misc import is_animated
 from properties.value import gen_properties_value
@@ -147,3 +150,30 @@ def gen_layer_blur(lottie, layers):
 		fill_blur_dict(blur_dict_y,layer,index.inc(),"vertical")
 		lottie.append(blur_dict_x)
 		lottie.append(blur_dict_y)
+
+def gen_blur_transform(lottie, layer):
+	"""
+	Generates the transform properties of the precomp which holds the layers
+	below a blur layer, when they are blurred together. The precomp is not
+	moved, only its offset inside the enclosing precomp is removed
+
+	Args:
+		lottie (dict)               : Transform properties in lottie format
+		layer  (common.Layer.Layer) : Synfig format blur layer
+
+	Returns:
+		(None)
+	"""
+	st = "<param name='{}'><vector><x>0.00</x><y>0.00</y></vector></param>"
+	anchor = Param(etree.fromstring(st.format("anchor")), layer)
+	anchor.animate("vector")
+	anchor.add_offset()
+
+	pos = Param(etree.fromstring(st.format("origin")), layer)
+	pos.animate("vector")
+	if settings.INSIDE_PRECOMP:
+		pos.add_offset()
+	anchor.animate("vector", True)
+	pos.animate("vector", True)
+
+	gen_helpers_transform(lottie, pos, anchor)
@@ -11,70 +11,53 @@ from layers.solid import gen_layer_solid
 from layers.image import gen_layer_image
 from layers.shape_solid import gen_layer_shape_solid
 from layers.preComp import gen_layer_precomp
-from layers.group import gen_layer_group
+from layers.group import gen_layer_group, is_trivial_group, flatten_group
 from layers.blur import gen_layer_blur
+from synfig.cull import get_cull_reason
+from common.Count import Count
 
 sys.path.append("..")
 
-def blur_test(lottie):
+def apply_blurs():
 	"""
-	This function will test if this layer has already been blurred or not
+	Called once after all the layers are generated. Appends to each layer the
+	gaussian blur effects of the blur layers above it, the effects of every
+	blur layer are generated only once
 
 	Args:
-		lottie (dict) : Lottie dictionary of effects in a layer
-
-	Returns:
-		(True if layer has already been blurred)
-	"""
-
-	for effects in lottie:
-		if effects["ty"] == 29:
-			return True
-
-	return False
-
-def calculate_blurs_needed(itr):
-	"""
-	This function will be called for each non blur layer to calculate all blur layers above it.
-
-	Args:
-		itr (int) : Position of layer in canvas
+		(None)
 
 	Returns:
 		(None)
 	"""
-	settings.non_blur_dictionary[itr] = [layer for layer in settings.blur_dictionary.keys() if layer < itr]
-
-def append_blur_dict(layer,itr,group_flag):
+	effects = {}
+	for level, layer in settings.blur_dictionary.items():
+		effects[level] = []
+		gen_layer_blur(effects[level], [layer])
+
+	for lottie in settings.blur_targets:
+		index = Count()
+		ef = lottie.setdefault("ef", [])
+		for level in lottie.pop("synfig_blurs"):
+			for effect in effects[level]:
+				ef.append(dict(effect, ix=index.inc()))
+
+def add_blur_target(lottie):
 	"""
-	This function will generate and assign the gaussian blur dictionary required for different layers
+	Records a non blur layer to be blurred by apply_blurs(), along with the
+	blur layers above it in its own canvas and in the enclosing ones. The
+	levels are kept in the layer till then, so that precomps are only shared
+	if their layers are blurred alike
 
 	Args:
-		layer (common.Layer.Layer) : Synfig format layer
-		itr   (int)                : Position of layer in canvas
-		group_flag (boolean)	   : True if layer belongs to a Group Layer
+		lottie (dict) : Lottie format layer
 
 	Returns:
 		(None)
 	"""
-	blur_dict = []
-	layers = [settings.blur_dictionary[layer_var] for layer_var in settings.non_blur_dictionary[itr]]
-	gen_layer_blur(blur_dict,layers)
-	if len(layers)!=0:
-		if group_flag:
-			for asset_index,_ in enumerate(settings.lottie_format["assets"]):
-				if "layers" in _.keys():
-					for index,val in enumerate(settings.lottie_format["assets"][asset_index]["layers"]):
-						blur_flag = blur_test(settings.lottie_format["assets"][asset_index]["layers"][index]["ef"])
-						if not blur_flag:
-							for blur in blur_dict:
-								settings.lottie_format["assets"][asset_index]["layers"][index]["ef"].append(blur)
-
-		else:
-			for index,val in enumerate(settings.lottie_format["layers"]):
-				if settings.lottie_format["layers"][index]["nm"] == layer.get_description():
-					for blur in blur_dict:
-						settings.lottie_format["layers"][index]["ef"].append(blur)
+	if settings.active_blurs:
+		lottie["synfig_blurs"] = list(settings.active_blurs)
+		settings.blur_targets.append(lottie)
 
 def gen_layers(lottie, canvas, layer_itr):
 	"""
@@ -102,7 +85,8 @@ def gen_layers(lottie, canvas, layer_itr):
 	if settings.WITHOUT_VARIABLE_WIDTH:
 		shape.add("outline")
 		settings.WITHOUT_VARIABLE_WIDTH = False
-		
+	num_blurs = len(settings.active_blurs)	# Blur layers of this canvas only blur the layers below them in it
+
 	while itr >= 0:
 		layer = canvas[itr]
 		if layer.get_type() not in supported_layers:  # Only supported layers
@@ -118,7 +102,21 @@ def gen_layers(lottie, canvas, layer_itr):
 			itr -= 1
 			continue
 
-		if layer.get_type() != "blur":
+		if settings.CULL_LAYERS:	# If the layer can never be seen
+			reason = get_cull_reason(layer)
+			if reason is not None:
+				logging.info(settings.CULLED_LAYER_TEXT, layer.get_description(), reason)
+				settings.culled_layers += 1
+				itr -= 1
+				continue
+
+		if layer.get_type() in group and is_trivial_group(layer):
+			flatten_group(lottie, layer)	# Layers of the group are added to this composition
+			settings.LEVEL += 1
+			itr -= 1
+			continue
+
+		if layer.get_type() not in blur or (settings.GROUP_BLUR and itr > 0):
 			lottie.append({})
 			layer.set_lottie_layer(lottie[-1])
 
@@ -126,37 +124,42 @@ def gen_layers(lottie, canvas, layer_itr):
 			gen_layer_shape(lottie[-1],
 							layer,
 							itr)
-			calculate_blurs_needed(settings.LEVEL)
-			append_blur_dict(layer,settings.LEVEL,settings.INSIDE_PRECOMP)
+			add_blur_target(lottie[-1])
 
 		elif layer.get_type() in solid:         # Goto solid layer
 			gen_layer_solid(lottie[-1],
 							layer,
 							itr)
-			calculate_blurs_needed(settings.LEVEL)
-			append_blur_dict(layer,settings.LEVEL,settings.INSIDE_PRECOMP)
+			add_blur_target(lottie[-1])
 
 		elif layer.get_type() in shape_solid:   # Goto shape_solid layer
 			gen_layer_shape_solid(lottie[-1],
 								  layer,
 								  itr)
-			calculate_blurs_needed(settings.LEVEL)
-			append_blur_dict(layer,settings.LEVEL,settings.INSIDE_PRECOMP)
+			add_blur_target(lottie[-1])
 
 		elif layer.get_type() in image:   # Goto image layer
 			gen_layer_image(lottie[-1],
 							layer,
 							itr)
-			calculate_blurs_needed(settings.LEVEL)
-			append_blur_dict(layer,settings.LEVEL,settings.INSIDE_PRECOMP)
+			add_blur_target(lottie[-1])
 
 		elif layer.get_type() in blur:
 			settings.blur_dictionary[settings.LEVEL] = layer
+			if not settings.GROUP_BLUR:
+				settings.active_blurs.append(settings.LEVEL)
+			elif itr > 0:	# Layers below are blurred together inside a precomp
+				gen_layer_precomp(lottie[-1],
+								  layer,
+								  itr)
+				del settings.active_blurs[num_blurs:]
+				return
 
 		elif layer.get_type() in pre_comp:      # Goto precomp layer
 			gen_layer_precomp(lottie[-1],
 							  layer,
 							  itr)
+			del settings.active_blurs[num_blurs:]
 			return  # other layers will be generated inside the precomp
 		elif layer.get_type() in group:       # Goto group layer
 			gen_layer_group(lottie[-1],
@@ -169,3 +172,4 @@ def gen_layers(lottie, canvas, layer_itr):
 
 		settings.LEVEL += 1
 		itr -= 1
+	del settings.active_blurs[num_blurs:]
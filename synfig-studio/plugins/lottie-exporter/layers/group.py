@@ -6,11 +6,12 @@ Store all functions corresponding to group layer in Synfig
 import sys
 import math
 import settings
+import layers.driver
 from common.Param import Param
 from common.Canvas import Canvas
 from common.Count import Count
-from common.misc import get_frame, approximate_equal, get_time
-from sources.precomp import add_precomp_asset
+from common.misc import get_frame, approximate_equal, get_time, is_animated, parse_time
+from sources.precomp import add_precomp_asset, share_precomp_asset
 from helpers.transform import gen_helpers_transform
 from helpers.blendMode import get_blend
 from synfig.animation import insert_waypoint_at_frame, to_Synfig_axis
@@ -59,6 +60,8 @@ def gen_layer_group(lottie, layer, idx):
         elif child.tag == "skew_angle":
             skew = Param(child, try_par)
 
+    # A plain value stays the same at every frame
+    grow_constant = is_animated(outline_grow[0]) != settings.ANIMATED and outline_grow[0].tag not in settings.CONVERT_METHODS
     outline_grow.animate("real")
 
     origin.animate("vector")
@@ -85,7 +88,10 @@ def gen_layer_group(lottie, layer, idx):
 
     # Store previous states, to be recovered at the end of group layer
     prev_state = settings.INSIDE_PRECOMP
-    settings.OUTLINE_GROW.append(outline_grow)    # Storing the outline grow in settings, will be used inside child outlines
+    # Storing the outline grow in settings, will be used inside child outlines
+    settings.OUTLINE_GROW.append({"param": outline_grow,
+                                  "constant": grow_constant and settings.OUTLINE_GROW[-1]["constant"],
+                                  "values": {}})
 
     settings.INSIDE_PRECOMP = True
 
@@ -101,23 +107,150 @@ def gen_layer_group(lottie, layer, idx):
     lottie["st"] = 0            # Don't know yet
     get_blend(lottie, layer)
 
-    # Time offset and speed
-    lottie["tm"] = {}
-    gen_time_remap(lottie["tm"], time_offset, time_dilation, index.inc())
+    # Time offset and speed, only if the time of the group differs
+    if get_static_value(time_offset[0]) != 0 or get_static_value(time_dilation[0]) != 1:
+        lottie["tm"] = {}
+        gen_time_remap(lottie["tm"], time_offset, time_dilation, index.inc())
 
     # Change opacity of layers for switch-group layers
     if layer.get_type() == "switch":
-        change_opacity_switch(layer, lottie)
+        change_opacity_switch(layer, lottie, canvas)
     # Change opacity of layers for group layers
     elif layer.get_type() == "group":
-        change_opacity_group(layer, lottie)
+        change_opacity_group(layer, lottie, canvas)
+
+    # Instances of the same canvas share one asset
+    share_precomp_asset(lottie)
 
     # Return to previous state, when we go outside the group layer
     settings.INSIDE_PRECOMP = prev_state
     settings.OUTLINE_GROW.pop()
 
 
-def change_opacity_group(layer, lottie):
+def get_static_value(node):
+    """
+    Returns the value of a plain Synfig value, which is neither animated nor
+    converted
+
+    Args:
+        node (lxml.etree._Element) : Synfig format value
+
+    Returns:
+        (float | tuple | bool) : The value, vectors as (x, y)
+        (None)                 : If the value can change with time
+    """
+    if node.tag in {"real", "angle", "integer"}:
+        return float(node.attrib["value"])
+    elif node.tag == "vector":
+        return (float(node.find("x").text), float(node.find("y").text))
+    elif node.tag == "time":
+        time = 0
+        for part in node.attrib["value"].split(" "):
+            if part.endswith("f"):
+                time += float(part[:-1]) / settings.lottie_format["fr"]
+            else:
+                time += parse_time(part)
+        return time
+    elif node.tag == "bool":
+        return node.attrib["value"] == "true"
+    return None
+
+
+def is_chosen_by_parent(layer):
+    """
+    Tells whether a layer belongs to a switch group or a group with z-range
+    enabled. Opacities of their layers are set by the position of the layers
+    in the group, so each layer needs its own Lottie layer
+
+    Args:
+        layer (common.Layer.Layer) : Synfig format layer
+
+    Returns:
+        (bool) : True if the parent group chooses between its layers
+    """
+    parent_param = layer.getparent().getparent_param()
+    if parent_param is None:
+        return False
+    parent = parent_param.getparent()
+    return parent.get_type() == "switch" or get_static_value(parent.get_param("z_range")[0]) is not False
+
+
+def is_trivial_group(layer):
+    """
+    Tells whether a group layer can be left out of the Lottie file, with its
+    layers generated directly in the parent composition. This is the case
+    when the group does not transform, fade, blend or re-time its layers, none
+    of its layers blend with or blur the layers below them, and the parent
+    group does not choose between its layers
+
+    Args:
+        layer (common.Layer.Layer) : Synfig format group layer
+
+    Returns:
+        (bool) : True if the group can be flattened
+    """
+    if layer.get_type() != "group" or is_chosen_by_parent(layer):
+        return False
+
+    transformation = layer.get_param("transformation")[0]
+    if transformation.tag != "composite":
+        return False
+    transform = {}
+    for child in transformation:
+        transform[child.tag] = get_static_value(child[0])
+
+    origin = get_static_value(layer.get_param("origin")[0])
+    if origin is None or transform.get("offset") != origin:
+        return False
+    if transform.get("angle") != 0 or transform.get("skew_angle") != 0 or transform.get("scale") != (1, 1):
+        return False
+    if get_static_value(layer.get_param("amount")[0]) != 1 or get_static_value(layer.get_param("blend_method")[0]) != 0:
+        return False
+    if get_static_value(layer.get_param("time_offset")[0]) != 0 or get_static_value(layer.get_param("time_dilation")[0]) != 1:
+        return False
+    if get_static_value(layer.get_param("z_range")[0]) is not False:
+        return False
+
+    for child in layer.get_param("canvas").get()[0]:
+        if child.tag != "layer":
+            continue
+        if child.attrib.get("type") in settings.BLUR_LAYER:
+            return False
+        for param in child:
+            if param.tag == "param" and param.attrib["name"] == "blend_method" and get_static_value(param[0]) != 0:
+                return False
+    return True
+
+
+def flatten_group(lottie, layer):
+    """
+    Generates the layers of a trivial group directly in the layers of the
+    parent composition, instead of a pre-composition
+
+    Args:
+        lottie (list)              : Lottie format layers of the parent composition
+        layer (common.Layer.Layer) : Synfig format group layer
+
+    Returns:
+        (None)
+    """
+    canvas = Canvas(layer.get_param("canvas"))
+    outline_grow = layer.get_param("outline_grow")
+    grow_constant = is_animated(outline_grow[0]) != settings.ANIMATED and outline_grow[0].tag not in settings.CONVERT_METHODS
+    outline_grow.animate("real")
+
+    # The transform layers of the group set settings.INSIDE_PRECOMP for the
+    # layers below them in the group only
+    prev_state = settings.INSIDE_PRECOMP
+    settings.OUTLINE_GROW.append({"param": outline_grow,
+                                  "constant": grow_constant and settings.OUTLINE_GROW[-1]["constant"],
+                                  "values": {}})
+    layers.driver.gen_layers(lottie, canvas, canvas.get_num_layers() - 1)
+    settings.INSIDE_PRECOMP = prev_state
+    settings.OUTLINE_GROW.pop()
+
+
+def change_opacity_group(layer, lottie, canvas):
     """
     Will make the opacity of underlying layers 0 according to the layers lying
     inside z range(if it is active)[z-range is non-animatable]
@@ -125,6 +258,7 @@ def change_opacity_group(layer, lottie):
     Args:
         layer (common.Layer.Layer) : Synfig format layer
         lottie (dict)      : Lottie format layer
+        canvas (common.Canvas.Canvas) : Canvas of the layer, as used for its asset
 
     Returns:
         (None)
@@ -132,12 +266,7 @@ def change_opacity_group(layer, lottie):
     z_range = layer.get_param("z_range")
     z_range_pos = layer.get_param("z_range_position")
     z_range_depth = layer.get_param("z_range_depth")
-    canvas = Canvas(layer.get_param("canvas"))
-
-    for assets in settings.lottie_format["assets"]:
-        if assets["id"] == lottie["refId"]:
-            root = assets
-            break
+    root = settings.asset_index[lottie["refId"]]
 
     # If z-range is non-active (static value)
     if z_range[0].attrib["value"] == "false":
@@ -212,25 +341,22 @@ def change_opacity_group(layer, lottie):
 
 
 
-def change_opacity_switch(layer, lottie):
+def change_opacity_switch(layer, lottie, canvas):
     """
     Will make the opacity of underlying layers 0 according to the active layer
 
     Args:
         layer (common.Layer.Layer) : Synfig format layer
         lottie (dict)      : Lottie format layer
+        canvas (common.Canvas.Canvas) : Canvas of the layer, as used for its asset
 
     Returns:
         (None)
     """
     layer_name = layer.get_param("layer_name")
-    canvas = Canvas(layer.get_param("canvas"))
 
     layer_name.animate_without_path("string")
-    for assets in settings.lottie_format["assets"]:
-        if assets["id"] == lottie["refId"]:
-            root = assets
-            break
+    root = settings.asset_index[lottie["refId"]]
 
     it = 0
     for c_layer in reversed(canvas.get_layer_list()):
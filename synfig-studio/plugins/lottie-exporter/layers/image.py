@@ -10,7 +10,8 @@ import settings
 from helpers.transform import gen_helpers_transform
 from helpers.blendMode import get_blend
 from common.Param import Param
-from sources.image import add_image_asset
+from common.misc import clip_frame_window, get_frame
+from sources.image import add_image_asset, update_image_display
 from shapes.rectangle import to_Synfig_axis
 sys.path.append("..")
 
@@ -36,9 +37,7 @@ def gen_layer_image(lottie, layer, idx):
     lottie["sr"] = settings.LAYER_DEFAULT_STRETCH
     lottie["ks"] = {}   # Transform properties to be filled
 
-    settings.lottie_format["assets"].append({})
-    st = add_image_asset(settings.lottie_format["assets"][-1], layer)
-    asset = settings.lottie_format["assets"][-1]
+    st, asset = add_image_asset(settings.lottie_format["assets"], layer)
 
     # setting class (jpg, png)
     lottie["cl"] = asset["p"].split(".")[-1]
@@ -50,6 +49,10 @@ def gen_layer_image(lottie, layer, idx):
     st["br"].animate("vector")
 
     st["scale"] = gen_image_scale(st["tl"], st["br"], asset["w"], asset["h"])
+    for waypoint in st["scale"][0]:
+        update_image_display(asset,
+                             float(waypoint[0].attrib["value"]) * asset["w"] / 100,
+                             float(waypoint[0].attrib["value2"]) * asset["h"] / 100)
     # Animation of this scale is needed again, as helpers/transform does not do
     # path calculation again
     st["scale"].animate("image_scale")
@@ -98,10 +101,13 @@ def gen_image_scale(animated_1, animated_2, width, height):
     animated_1.update_frame_window(window)
     animated_2.update_frame_window(window)
     # Minimizing the window size
-    if window["first"] == sys.maxsize and window["last"] == -1:
-        window["first"] = window["last"] = 0
+    clip_frame_window(window)
     fr = window["first"]
 
+    # The dummy waypoints are at frames 0 and 1, the window can start later
+    for itr in range(2):
+        root[0][itr].attrib["time"] = str((fr + itr) / settings.lottie_format["fr"]) + "s"
+
     # Filling the first 2 frames with there original scale values
     fill_image_scale_at_frame(image_scale[0], animated_1, animated_2, width, height, fr)
     fill_image_scale_at_frame(image_scale[0], animated_1, animated_2, width, height, fr + 1)
@@ -145,8 +151,10 @@ def fill_image_scale_at_frame(scale_animated, animated_1, animated_2, width, hei
     scale_x = (pos2[0] - pos1[0]) * 100 / width
     scale_y = (pos1[1] - pos2[1]) * 100 / height
 
-    # Assumption: all frames till the maximum are present in the animation
-    scale_animated[frame][0].attrib["value"] = str(scale_x)
-    scale_animated[frame][0].attrib["value2"] = str(scale_y)
-    scale_animated[frame].attrib["before"] = "linear"
-    scale_animated[frame].attrib["after"] = "linear"
+    # Assumption: all frames from the first one till the maximum are present
+    # in the animation
+    waypoint = scale_animated[frame - get_frame(scale_animated[0])]
+    waypoint[0].attrib["value"] = str(scale_x)
+    waypoint[0].attrib["value2"] = str(scale_y)
+    waypoint.attrib["before"] = "linear"
+    waypoint.attrib["after"] = "linear"
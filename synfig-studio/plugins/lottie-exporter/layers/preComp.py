@@ -5,10 +5,11 @@ Store all functions corresponding to pre composition in lottie
 
 import sys
 import settings
-from sources.precomp import add_precomp_asset
+from sources.precomp import add_precomp_asset, share_precomp_asset
 from layers.rotate_layer import gen_layer_rotate
 from layers.scale_layer import gen_layer_scale
 from layers.translate_layer import gen_layer_translate
+from layers.blur import gen_blur_transform, gen_layer_blur
 sys.path.append("..")
 
 
@@ -46,10 +47,16 @@ def gen_layer_precomp(lottie, layer, idx):
     elif layer.get_type() == "stretch":
         gen_layer_scale(lottie["ks"], layer, "stretch_layer")
         settings.INSIDE_PRECOMP = True
+    elif layer.get_type() in settings.BLUR_LAYER:
+        # the layers below are blurred together, by one effect on this layer
+        gen_blur_transform(lottie["ks"], layer)
+        gen_layer_blur(lottie.setdefault("ef", []), [layer])
+        settings.INSIDE_PRECOMP = True
 
     settings.lottie_format["assets"].append({})
     asset = add_precomp_asset(settings.lottie_format["assets"][-1], layer.getparent(), idx)
     lottie["refId"] = asset
+    share_precomp_asset(lottie)
 
 
     lottie["w"] = settings.lottie_format["w"] + settings.ADDITIONAL_PRECOMP_WIDTH # Experimental increase in width and height of precomposition
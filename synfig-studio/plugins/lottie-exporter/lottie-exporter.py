@@ -16,10 +16,11 @@ sys.path.append(os.path.abspath(os.path.dirname(__file__)))
 import json
 import logging
 from lxml import etree
-from canvas import gen_canvas
-from layers.driver import gen_layers
+from canvas import gen_canvas, check_time
+from layers.driver import gen_layers, apply_blurs
 from common.misc import modify_final_dump
 from common.Canvas import Canvas
+from sources.image import save_image_assets
 import settings
 import argparse
 
@@ -50,6 +51,12 @@ def parse(file_name):
     settings.lottie_format["layers"] = []
     canvas = Canvas(root, True)
     gen_layers(settings.lottie_format["layers"], canvas, canvas.get_num_layers() - 1)
+    apply_blurs()
+    if settings.skipped_frames:
+        logging.info(settings.SKIPPED_FRAMES_TEXT, settings.skipped_frames)
+    if settings.culled_layers:
+        logging.info(settings.CULLED_LAYERS_TEXT, settings.culled_layers)
+    save_image_assets()
 
     return json.dumps(modify_final_dump(settings.lottie_format))
 
@@ -138,9 +145,41 @@ def init_logs():
 parser = argparse.ArgumentParser()
 parser.add_argument("infile")
 parser.add_argument("outfile")
+parser.add_argument("--flatness", type=float,
+                    help="max deviation(in pixels) of sampled outlines from the curves, 0 disables adaptive sampling")
+parser.add_argument("--quality", choices=sorted(settings.QUALITY_PRESETS), default="normal",
+                    help="sampling quality preset, --flatness overrides its flatness")
+parser.add_argument("--begin", type=check_time,
+                    help="begin time of the exported range, like 2s or 48f, instead of the canvas begin-time")
+parser.add_argument("--end", type=check_time,
+                    help="end time of the exported range, instead of the canvas end-time")
+parser.add_argument("--fps", type=float,
+                    help="frame rate of the export, instead of the canvas fps")
+parser.add_argument("--downscale-images", action="store_true",
+                    help="resample the images to the largest size they are displayed at, needs Pillow")
+parser.add_argument("--inline-images", type=int, default=settings.INLINE_IMAGE_SIZE, metavar="BYTES",
+                    help="embed the images of at most BYTES bytes in the json as data URIs")
+parser.add_argument("--jobs", type=int, default=settings.JOBS,
+                    help="number of processes sampling the frames of outlines and regions, 0 uses all the cores")
+parser.add_argument("--group-blur", action="store_true",
+                    help="blur the layers below each blur layer together in one precomp, instead of blurring every layer")
+parser.add_argument("--cull", action="store_true",
+                    help="leave out the layers which are transparent or outside the view box in all the exported frames")
 ns = parser.parse_args()
 	
 settings.init()
+preset = settings.QUALITY_PRESETS[ns.quality]
+settings.SAMPLES = preset["samples"]
+settings.FLATNESS_TOLERANCE = preset["flatness"] if ns.flatness is None else ns.flatness
+settings.SHAPE_EASING_TOLERANCE = preset["shape_easing"]
+settings.BEGIN_TIME = ns.begin
+settings.END_TIME = ns.end
+settings.FPS = ns.fps
+settings.DOWNSCALE_IMAGES = ns.downscale_images
+settings.INLINE_IMAGE_SIZE = ns.inline_images
+settings.JOBS = ns.jobs
+settings.GROUP_BLUR = ns.group_blur
+settings.CULL_LAYERS = ns.cull
 
 out = parse(ns.infile)
 if ns.outfile.endswith(".html"):
@@ -5,6 +5,9 @@ lottie
 """
 
 import sys
+import copy
+from lxml import etree
+import settings
 from properties.shapePropKeyframe.advanced_outline import gen_bline_advanced_outline
 from properties.shapePropKeyframe.outline import gen_bline_outline
 from properties.shapePropKeyframe.region import gen_bline_region
@@ -32,7 +35,16 @@ def gen_properties_shapeKeyframed(lottie, node, idx):
     """
     lottie["ix"] = idx
     lottie["a"] = 1
+
+    # Shapes with the same path(like the masks of layers linked to one
+    # exported bline) are sampled only once
+    key = get_shape_key(node)
+    if key in settings.shape_paths:
+        lottie["k"] = copy.deepcopy(settings.shape_paths[key])
+        return
+
     lottie["k"] = []
+    settings.shape_paths[key] = lottie["k"]
     if isinstance(node, Layer) and node.get_type() == "circle":
         gen_list_circle(lottie["k"], node)
     elif isinstance(node, Layer) and node.get_type() in {"rectangle", "filled_rectangle"}:
@@ -49,3 +61,34 @@ def gen_properties_shapeKeyframed(lottie, node, idx):
         gen_bline_outline(lottie["k"], node)
     elif isinstance(node, Param) and node.get_layer_type() == "advanced_outline":
         gen_bline_advanced_outline(lottie["k"], node)
+
+
+def get_shape_key(node):
+    """
+    Identifies the path of a shape by the final xml of the params of its layer
+    which can change the path, the path of the layer being type dependent.
+    Offsets inside precomps are already inserted in this xml, and the frame
+    window of the path only depends on the waypoints in it. Outlines also
+    depend on the outline grow of the groups they lie in
+
+    Args:
+        node (common.Layer.Layer | common.Param.Param) : Shape/path in Synfig format
+
+    Returns:
+        (tuple) : Key of the path in settings.shape_paths
+    """
+    if isinstance(node, Layer):
+        layer = node
+        name = None
+    else:
+        layer = node.get_layer()
+        name = node.param.attrib["name"]
+    params = []
+    for child in layer.get_layer():
+        if child.tag == "param" and child.attrib["name"] not in settings.SHAPE_STYLE_PARAMS:
+            params.append(etree.tostring(child))
+    grow = []
+    if layer.get_type() in {"outline", "advanced_outline"}:
+        for level in settings.OUTLINE_GROW[1:]:
+            grow.append(etree.tostring(level["param"].param))
+    return (layer.get_type(), name, tuple(params), tuple(grow))
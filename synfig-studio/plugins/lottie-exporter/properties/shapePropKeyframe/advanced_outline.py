@@ -6,8 +6,10 @@ in Lottie format
 
 import sys
 import math
-import copy
+import bisect
+import settings
 from common.Bline import Bline
+from common.misc import clip_frame_window
 from common.WidthPoint import WidthPoint
 from common.WidthPointList import WidthPointList
 from common.DashItemList import DashItemList
@@ -15,8 +17,8 @@ from common.Vector import Vector
 from common.Hermite import Hermite
 from common.Angle import RadAngle, SinAngle, CosAngle, DegAngle
 from synfig.animation import to_Synfig_axis
-from properties.shapePropKeyframe.helper import add, insert_dict_at_adv_outline, animate_tangents
-from properties.shapePropKeyframe.outline import line_intersection, get_outline_grow
+from properties.shapePropKeyframe.helper import add, insert_dict_at_adv_outline, animate_tangents, get_samples, fit_side, sample_frames
+from properties.shapePropKeyframe.outline import line_intersection, get_outline_grow, equalize_length
 sys.path.append("../../")
 
 
@@ -149,8 +151,7 @@ def gen_bline_advanced_outline(lottie, bline_point):
     dash_offset.animate("real")
 
     # Minimizing the window size
-    if window["first"] == sys.maxsize and window["last"] == -1:
-        window["first"] = window["last"] = 0
+    clip_frame_window(window)
     ################# END OF SECTION 1 ###################
 
     ################ SECTION 2 ###########################
@@ -158,25 +159,28 @@ def gen_bline_advanced_outline(lottie, bline_point):
 
     # Store all side_a, side_b values; because we need to make them equal in
     # size in order to render properly in lottie
+    def sample(fr):
+        st_list_value = synfig_advanced_outline(bline, outer_width, expand,
+                start_tip, end_tip, cusp_type, smoothness, homogeneous,
+                dash_enabled, dash_offset, dash_item_list, width_point_list,
+                fr)
+        en_list_value = synfig_advanced_outline(bline, outer_width, expand,
+                start_tip, end_tip, cusp_type, smoothness, homogeneous,
+                dash_enabled, dash_offset, dash_item_list, width_point_list,
+                fr + 1)
+        return st_list_value, en_list_value
+
     st_list = []
     en_list = []
     lottie_st = []
     lottie_en = []
 
     fr = window["first"]
-    while fr <= window["last"]:
+    for st_list_value, en_list_value in sample_frames(sample, window["first"], window["last"]):
         st_val, en_val = insert_dict_at_adv_outline(lottie, -1, fr, False)  # This loop needs to be considered somewhere down
         lottie_st.append([st_val, fr])
         lottie_en.append([en_val, fr+1])
 
-        st_list_value = synfig_advanced_outline(bline, outer_width, expand,
-                start_tip, end_tip, cusp_type, smoothness, homogeneous,
-                dash_enabled, dash_offset, dash_item_list, width_point_list,
-                fr)
-        en_list_value = synfig_advanced_outline(bline, outer_width, expand,
-                start_tip, end_tip, cusp_type, smoothness, homogeneous,
-                dash_enabled, dash_offset, dash_item_list, width_point_list,
-                fr + 1)
         st_list.append(st_list_value)
         en_list.append(en_list_value)
 
@@ -194,37 +198,20 @@ def gen_bline_advanced_outline(lottie, bline_point):
 
 def append_all_lists(st_list, en_list, lottie_st, lottie_en, origin_p):
     """
-    This function collects all the lists(at each different frame), then
-    makes all those lists of equal size(lottie style), and then appends them to
-    the lottie dictionary
+    This function collects all the lists(at each different frame), appends
+    them to the lottie dictionary, and then makes all those lists of equal
+    size(lottie style)
 
     Args:
         st_list (list[Floats]): These are the points obtained from synfig at frame "st"
         en_list (list[Floats]): These are the points obtained from synfig at frame "en"
+        lottie_st (list[(dict, Int)]): Contains address of lottie's "st" dict and frame's value
         lottie_en (list[(dict, Int)]): Contains address of lottie's "en" dict and frame's value
         origin_p (common.param.param): Lottie format origin of adv outline layer
     
     Returns:
         (None)
     """
-    # Find maximum size among all the lists
-    mx = 0
-    for st in st_list:
-        mx = max(mx, len(st))
-    for en in en_list:
-        mx = max(mx, len(en))
-
-    # All the lists should of size mx
-    for st in st_list:
-        diff = mx - len(st)
-        last_value = copy.deepcopy(st[-1])
-        st.extend([last_value for i in range(diff)])
-
-    for en in en_list:
-        diff = mx - len(en)
-        last_value = copy.deepcopy(en[-1])
-        en.extend([last_value for i in range(diff)])
-
     # Now render 
     for i in range(0, len(lottie_st)):
         cur_frame = lottie_st[i][1]
@@ -238,6 +225,9 @@ def append_all_lists(st_list, en_list, lottie_st, lottie_en, origin_p):
         add(en_list[i], lottie_en[i][0], origin_cur)
         lottie_en[i][0]["h"] = 1
 
+    # All the lists should be of the same size
+    equalize_length([st[0] for st in lottie_st], [en[0] for en in lottie_en])
+
 
 def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
         cusp_type, smoothness_p, homogeneous, dash_enabled_p, dash_offset_p,
@@ -264,7 +254,6 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
         (list[(common.Vector.Vector, common.Vector.Vector, common.Vector.Vector)]): (2D points value, tangent1, tangent2)
     """
     CUSP_TANGENT_ADJUST = 0.025
-    SAMPLES = 50
     EPSILON = 0.000000001
     fast_ = False   # This parameter has been removed from Synfig 1.4 onwards
     smoothness = to_Synfig_axis(smoothness_p.get_value(fr), "real")
@@ -317,11 +306,15 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
     if not blineloop and bline_size == 1:
         return
 
+    # Segment lengths of the bline at this frame, shared by all the position
+    # conversions below
+    arc_table = bline_length_table(bline_list, blineloop)
+
     bindex = 0.0
     biter = 0
     while biter != bend:
         bline_pos.append(bindex * bezier_size)
-        hbline_pos.append(bline_pos[-1] if fast_ else std_to_hom(bline_list, bline_pos[-1], wplistloop, blineloop, fr))
+        hbline_pos.append(bline_pos[-1] if fast_ else std_to_hom(bline_list, bline_pos[-1], wplistloop, blineloop, fr, arc_table))
         bindex += 1
         biter += 1
 
@@ -385,19 +378,19 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
 
             if wpfb_int or wpba_int:
                 if wpfront.get_position() != 0.0:
-                    i = copy.deepcopy(wpback)
-                    n = copy.deepcopy(wpfront)
+                    i = wpback.copy()
+                    n = wpfront.copy()
                     if not homogeneous and not fast_:
-                        i.set_position(std_to_hom(bline_list, i.get_position(), wplistloop, blineloop, fr)) 
-                        n.set_position(std_to_hom(bline_list, n.get_position(), wplistloop, blineloop, fr)) 
+                        i.set_position(std_to_hom(bline_list, i.get_position(), wplistloop, blineloop, fr, arc_table)) 
+                        n.set_position(std_to_hom(bline_list, n.get_position(), wplistloop, blineloop, fr, arc_table)) 
                     wplist.append(WidthPoint(0.0, widthpoint_interpolate(i, n, 0.0, smoothness), 0, 0))
                     inserted_first = True
                 if wpback.get_position() != 1.0:
-                    i = copy.deepcopy(wpback)
-                    n = copy.deepcopy(wpfront)
+                    i = wpback.copy()
+                    n = wpfront.copy()
                     if not homogeneous and not fast_:
-                        i.set_position(std_to_hom(bline_list, i.get_position(), wplistloop, blineloop, fr)) 
-                        n.set_position(std_to_hom(bline_list, n.get_position(), wplistloop, blineloop, fr)) 
+                        i.set_position(std_to_hom(bline_list, i.get_position(), wplistloop, blineloop, fr, arc_table)) 
+                        n.set_position(std_to_hom(bline_list, n.get_position(), wplistloop, blineloop, fr, arc_table)) 
                     wplist.append(WidthPoint(1.0, widthpoint_interpolate(i, n, 1.0, smoothness), 0, 0))
                     inserted_last = True
         else:
@@ -406,10 +399,8 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
 
     wplist = sorted(wplist)
 
-    step = 1.0/SAMPLES/bline_size
-
     if dash_enabled:
-        blinelength = bline_length(bline_list, blineloop, None, fr)
+        blinelength = arc_table["total"]
         if blinelength > EPSILON:
             dashes_length = 0.0
             diter = 0
@@ -427,8 +418,8 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
                 while dpos < blinelength:
                     before_pos = (dpos + dilist[diter].get_offset())/blinelength
                     after_pos = (dpos + dilist[diter].get_offset() + dilist[diter].get_length())/blinelength 
-                    before_pos = before_pos if homogeneous else hom_to_std(bline_list, before_pos, wplistloop, blineloop, fr)
-                    after_pos = after_pos if homogeneous else hom_to_std(bline_list, after_pos, wplistloop, blineloop, fr)
+                    before_pos = before_pos if homogeneous else hom_to_std(bline_list, before_pos, wplistloop, blineloop, fr, arc_table)
+                    after_pos = after_pos if homogeneous else hom_to_std(bline_list, after_pos, wplistloop, blineloop, fr, arc_table)
                     before = WidthPoint(before_pos, 1.0, dilist[diter].get_side_type_before(), 0, True)
                     after = WidthPoint(after_pos, 1.0, 0, dilist[diter].get_side_type_after(), True)
                     dwplist.append(before)
@@ -457,8 +448,8 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
                 while dpos > 0.0:
                     before_pos = (dpos - dilist[rditer].get_length())/blinelength
                     after_pos = (dpos) / blinelength
-                    before_pos = before_pos if homogeneous else hom_to_std(bline_list, before_pos, wplistloop, blineloop, fr)
-                    after_pos = after_pos if homogeneous else hom_to_std(bline_list, after_pos, wplistloop, blineloop, fr)
+                    before_pos = before_pos if homogeneous else hom_to_std(bline_list, before_pos, wplistloop, blineloop, fr, arc_table)
+                    after_pos = after_pos if homogeneous else hom_to_std(bline_list, after_pos, wplistloop, blineloop, fr, arc_table)
                     before = WidthPoint(before_pos, 1.0, dilist[rditer].get_side_type_before(), 0, True)
                     after = WidthPoint(after_pos, 1.0, 0, dilist[rditer].get_side_type_after(), True)
                     dwplist.insert(0, after)
@@ -504,7 +495,7 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
                         while dwiter != len(dwplist):
                             dwiter_pos = dwplist[dwiter].get_position()
                             if dwiter_pos > witer_pos and dwiter_pos < wnext_pos:
-                                fdwplist.append(copy.deepcopy(dwplist[dwiter]))
+                                fdwplist.append(dwplist[dwiter].copy())
                             dwiter += 1
                     witer = wnext
                     wnext += 1
@@ -522,7 +513,7 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
                     while witer != len(wplist):
                         witer_pos = wplist[witer].get_position()
                         if witer_pos <= dwnext_pos and witer_pos >= dwiter_pos:
-                            fdwplist.append(copy.deepcopy(wplist[witer]))
+                            fdwplist.append(wplist[witer].copy())
                         witer += 1
                     dwnext += 1
                     dwiter = dwnext
@@ -530,48 +521,40 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
                         break
                     dwnext += 1
 
-    cwplist = []
-    for my_iterator in wplist:
-        cwplist.append(copy.deepcopy(my_iterator))
-    scwplist = []
-    for my_iterator in wplist:
-        scwplist.append(copy.deepcopy(my_iterator))
+    cwplist = [my_iterator.copy() for my_iterator in wplist]
+    scwplist = [my_iterator.copy() for my_iterator in wplist]
 
     if homogeneous:
         scwiter = 0
         while scwiter != len(scwplist):
-            scwplist[scwiter].set_position(hom_to_std(bline_list, scwplist[scwiter].get_position(), wplistloop, blineloop, fr)) 
+            scwplist[scwiter].set_position(hom_to_std(bline_list, scwplist[scwiter].get_position(), wplistloop, blineloop, fr, arc_table)) 
             scwiter += 1
     else:
         cwiter = 0
         while cwiter != len(cwplist):
-            cwplist[cwiter].set_position(std_to_hom(bline_list, cwplist[cwiter].get_position(), wplistloop, blineloop, fr))
+            cwplist[cwiter].set_position(std_to_hom(bline_list, cwplist[cwiter].get_position(), wplistloop, blineloop, fr, arc_table))
             cwiter += 1
 
     if dash_enabled:
-        wplist = []
-        for my_iterator in fdwplist:
-            wplist.append(copy.deepcopy(my_iterator))
-        wplist = sorted(wplist)
+        # fdwplist already holds copies, which are not used anywhere else
+        wplist = sorted(fdwplist)
         witer = 0
 
 
     if len(wplist) == 0:
         wplist.append(WidthPoint(0.5, 1.0, 4, 4, True))
 
-    swplist = []
-    for my_iterator in wplist:
-        swplist.append(copy.deepcopy(my_iterator))
+    swplist = [my_iterator.copy() for my_iterator in wplist]
 
     if homogeneous:
         switer = 0
         while switer != len(swplist):
-            swplist[switer].set_position(hom_to_std(bline_list, swplist[switer].get_position(), wplistloop, blineloop, fr))
+            swplist[switer].set_position(hom_to_std(bline_list, swplist[switer].get_position(), wplistloop, blineloop, fr, arc_table))
             switer += 1
     else:
         witer = 0
         while witer != len(wplist):
-            wplist[witer].set_position(std_to_hom(bline_list, wplist[witer].get_position(), wplistloop, blineloop, fr))
+            wplist[witer].set_position(std_to_hom(bline_list, wplist[witer].get_position(), wplistloop, blineloop, fr, arc_table))
             witer += 1
     
     wnext = 0
@@ -611,6 +594,10 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
         if wplist[last].get_side_type_after() == 0:
             wplist[last].set_side_type_after(dend_tip)
 
+    # Farthest the outline can get from the bline, used for deciding the samples
+    max_w = gv*(abs(expand) + abs(width)*0.5*max([abs(wp.get_width()) for wp in cwplist + wplist]))
+    step_biter = None
+
     # Main loop
     while True:
         iter_t = bline_list[biter].get_tangent2()
@@ -623,6 +610,9 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
                         bline_list[bnext].get_vertex(),
                         iter_t,
                         next_t)
+        if step_biter != biter:
+            step = 1.0/get_samples(curve, settings.SAMPLES, max_w)/bline_size
+            step_biter = biter
         if iter_t_mag == 0.0:
             iter_t = curve.derivative(CUSP_TANGENT_ADJUST)
         if next_t_mag == 0.0:
@@ -839,7 +829,7 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
                 n = cwplist[cwnext]
             po = ipos
             if not fast_:
-                po = std_to_hom(bline_list, ipos, wplistloop, blineloop, fr)
+                po = std_to_hom(bline_list, ipos, wplistloop, blineloop, fr, arc_table)
             w = 0.0
             if done_tip:
                 w = 0
@@ -859,7 +849,9 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
         side_b = remove_after_null(side_b)
         side_b.append(side_b[0])    # Closing the contour:: contour->close()
 
-        side_a.extend(side_b)
+        # Turn the sampled polylines back into curves
+        side_a = fit_side(side_a)
+        side_a.extend(fit_side(side_b))
         return side_a
 
 
@@ -869,7 +861,8 @@ def synfig_advanced_outline(bline, outer_width_p, expand_p, start_tip, end_tip,
     side_a = remove_after_null(side_a)
     side_a.append(side_a[0])        # Closing the contour::   contour->close()
 
-    return side_a
+    # Turn the sampled polyline back into curves
+    return fit_side(side_a)
 
 
 def remove_after_null(side):
@@ -907,7 +900,6 @@ def add_cusp(side_a, side_b, vertex, curr, last, w, cusp_type):
     """
     CUSP_THRESHOLD = 0.40
     SPIKE_AMOUNT = 4
-    SAMPLES = 50
     t1 = last.perp().norm()
     t2 = curr.perp().norm()
     cross = t1*t2.perp()
@@ -941,10 +933,11 @@ def add_cusp(side_a, side_b, vertex, curr, last, w, cusp_type):
                             p2,
                             Vector(-tangent*w*SinAngle(angle*0+offset).get(), tangent*w*CosAngle(angle*0+offset).get()),
                             Vector(-tangent*w*SinAngle(angle*1+offset).get(), tangent*w*CosAngle(angle*1+offset).get()))
+            step = 1.0/get_samples(curve, settings.SAMPLES/4.0)
             n = 0.0
             while n < 0.999999:
                 side_a.append([curve.value(n), Vector(0, 0), Vector(0, 0)]) 
-                n += 4.0 / SAMPLES
+                n += step
 
         if cross < 0:
             p1 = vertex - t1*w
@@ -959,10 +952,11 @@ def add_cusp(side_a, side_b, vertex, curr, last, w, cusp_type):
                             p2,
                             Vector(-tangent*w*SinAngle(angle*1+offset).get(), tangent*w*CosAngle(angle*1+offset).get()),
                             Vector(-tangent*w*SinAngle(angle*0+offset).get(), tangent*w*CosAngle(angle*0+offset).get()))
+            step = 1.0/get_samples(curve, settings.SAMPLES/4.0)
             n = 0.0
             while n < 0.999999:
                 side_b.append([curve.value(n), Vector(0, 0), Vector(0, 0)]) 
-                n += 4.0 / SAMPLES
+                n += step
     return
              
 
@@ -984,7 +978,6 @@ def add_tip(side_a, side_b, vertex, tangent, wp, gv, width, expand):
         (None)
     """
     ROUND_END_FACTOR = 4
-    SAMPLES = 50
     w = gv * (expand + width*0.5*wp.get_width())
     if wp.get_side_type_before() == 1:
         curve = Hermite(vertex-tangent.perp()*w,
@@ -993,11 +986,12 @@ def add_tip(side_a, side_b, vertex, tangent, wp, gv, width, expand):
                         tangent*w*ROUND_END_FACTOR)
         side_a.append([vertex, Vector(0, 0), Vector(0, 0)])
         side_b.append([vertex, Vector(0, 0), Vector(0, 0)])
+        step = 1.0/get_samples(curve, settings.SAMPLES/2.0)
         n = 0.0
         while n < 0.499999:
             side_a.append([curve.value(0.5+n), Vector(0, 0), Vector(0, 0)]) 
             side_b.append([curve.value(0.5-n), Vector(0, 0), Vector(0, 0)]) 
-            n += 2.0/SAMPLES
+            n += step
         side_a.append([curve.value(1.0), Vector(0, 0), Vector(0, 0)])
         side_b.append([curve.value(0.0), Vector(0, 0), Vector(0, 0)])
     elif wp.get_side_type_before() == 2:
@@ -1025,11 +1019,12 @@ def add_tip(side_a, side_b, vertex, tangent, wp, gv, width, expand):
                         vertex+tangent.perp()*w,
                         tangent*w*ROUND_END_FACTOR,
                         -tangent*w*ROUND_END_FACTOR)
+        step = 1.0/get_samples(curve, settings.SAMPLES/2.0)
         n = 0.0
         while n < 0.499999:
             side_a.append([curve.value(1-n), Vector(0, 0), Vector(0, 0)]) 
             side_b.append([curve.value(n), Vector(0, 0), Vector(0, 0)]) 
-            n += 2.0/SAMPLES
+            n += step
         side_a.append([curve.value(0.5), Vector(0, 0), Vector(0, 0)]) 
         side_b.append([curve.value(0.5), Vector(0, 0), Vector(0, 0)]) 
         side_a.append([vertex, Vector(0, 0), Vector(0, 0)]) 
@@ -1077,7 +1072,7 @@ def bline_to_bezier(bline_pos, origin, bezier_size):
     return bline_pos
 
 
-def hom_to_std(bline_list, pos, index_loop, bline_loop, fr):
+def hom_to_std(bline_list, pos, index_loop, bline_loop, fr, table=None):
     """
     Synfig function: https://github.com/synfig/synfig/blob/15607089680af560ad031465d31878425af927eb/synfig-core/src/synfig/valuenodes/valuenode_bline.cpp#L346
 
@@ -1087,6 +1082,7 @@ def hom_to_std(bline_list, pos, index_loop, bline_loop, fr):
         index_loop (Bool):
         bline_loop (Bool):
         fr (Int): Value of frame 
+        table (:obj: `dict`, optional): Arc-length table of the bline at this frame
 
     Returns:
         (Float)
@@ -1112,52 +1108,40 @@ def hom_to_std(bline_list, pos, index_loop, bline_loop, fr):
         if pos < 0: pos = 0
         if pos > 1: pos = 1
 
-    tl = 0
-    pl = 0
-    bl = 0
-    lengths = []
-    tl = bline_length(bline_list, bline_loop, lengths, fr)
+    if table is None:
+        table = bline_length_table(bline_list, bline_loop)
+    lengths = table["lengths"]
+    cumulative = table["cumulative"]
+    tl = table["total"]
     mpl = pos*tl
-    nxt = 0
-    itr = 0
-    if bline_loop:  itr = len(bline_list) - 1
-    else:
-        itr = nxt
-        nxt = nxt + 1
-    liter = 0
-
-    while mpl > pl and nxt != len(bline_list):
-        pl += lengths[liter]
-        bl = lengths[liter]
-        itr = nxt
-        nxt += 1
-        liter += 1
-        from_vertex += 1
 
+    # Find the segment in which mpl lies
+    from_vertex = min(bisect.bisect_left(cumulative, mpl), len(lengths))
+    pl = cumulative[from_vertex]
+    bl = lengths[from_vertex-1] if from_vertex else 0
     if pl > mpl:
-        liter -= 1
-        nxt -= 1
-        if nxt == 0:
-            itr = len(bline_list) - 1
-        else:
-            itr -= 1
-        pl -= lengths[liter]
         from_vertex -= 1
+        pl -= lengths[from_vertex]
 
-    blinepoint0 = bline_list[itr]
+    nxt = from_vertex if bline_loop else from_vertex + 1
+    itr = len(bline_list) - 1 if nxt == 0 else nxt - 1
 
-    a = blinepoint0.get_vertex()
-    c = blinepoint0.get_tangent2()
-
-    if nxt == len(bline_list):
-        b = Vector(0, 0)
-        d = Vector(0, 0)
+    if 0 <= from_vertex < len(table["curves"]):
+        curve = table["curves"][from_vertex]
     else:
-        blinepoint1 = bline_list[nxt]
-        b = blinepoint1.get_vertex()
-        d = blinepoint1.get_tangent1()
+        blinepoint0 = bline_list[itr]
+        a = blinepoint0.get_vertex()
+        c = blinepoint0.get_tangent2()
 
-    curve = Hermite(a, b, c, d)
+        if nxt == len(bline_list):
+            b = Vector(0, 0)
+            d = Vector(0, 0)
+        else:
+            blinepoint1 = bline_list[nxt]
+            b = blinepoint1.get_vertex()
+            d = blinepoint1.get_tangent1()
+
+        curve = Hermite(a, b, c, d)
 
     sn = 0.0
     sn1 = 0.0
@@ -1186,7 +1170,7 @@ def hom_to_std(bline_list, pos, index_loop, bline_loop, fr):
 
     return int_pos + (from_vertex + sn)/size - one
 
-def std_to_hom(bline_list, pos, index_loop, bline_loop, fr):
+def std_to_hom(bline_list, pos, index_loop, bline_loop, fr, table=None):
     """
     Synfig function: https://github.com/synfig/synfig/blob/15607089680af560ad031465d31878425af927eb/synfig-core/src/synfig/valuenodes/valuenode_bline.cpp#L292
 
@@ -1196,6 +1180,7 @@ def std_to_hom(bline_list, pos, index_loop, bline_loop, fr):
         index_loop (Bool):
         bline_loop (Bool):
         fr (Int): Frame number currently processing
+        table (:obj: `dict`, optional): Arc-length table of the bline at this frame
 
     Returns:
         (Float)
@@ -1219,35 +1204,16 @@ def std_to_hom(bline_list, pos, index_loop, bline_loop, fr):
         if pos < 0: pos = 0
         if pos > 1: pos = 1
 
-    tl = 0
-    pl = 0
-    lengths = []
-    tl = bline_length(bline_list, bline_loop, lengths, fr)
+    if table is None:
+        table = bline_length_table(bline_list, bline_loop)
+    tl = table["total"]
     if tl == 0.0:   return pos
     from_vertex = int(pos*size)
+    pl = table["cumulative"][from_vertex]
 
-    liter = 0
-    i = 0
-    while i < from_vertex:
-        pl += lengths[liter]
-        i += 1
-        liter += 1
-
-    nxt = 0 # bline.begin()
-    itr = 0
-    if bline_loop:
-        itr = len(bline_list) - 1
-    else:
-        itr = nxt
-        nxt = nxt + 1
     if from_vertex > size - 1:
         from_vertex = size - 1
-    bline_point0 = bline_list[nxt+from_vertex-1] if from_vertex else bline_list[itr]
-    bline_point1 = bline_list[nxt+from_vertex]
-    curve = Hermite(bline_point0.get_vertex(),
-                    bline_point1.get_vertex(),
-                    bline_point0.get_tangent2(),
-                    bline_point1.get_tangent1())
+    curve = table["curves"][from_vertex]
     pl += curve.find_distance(0.0, pos*size - from_vertex)
 
     return int_pos + pl/tl-one
@@ -1266,10 +1232,30 @@ def bline_length(bline_list, bline_loop, lengths, fr):
     Returns:
         (Float)
     """
+    table = bline_length_table(bline_list, bline_loop)
+    if lengths is not None:
+        lengths.extend(table["lengths"])
+    return table["total"]
+
+
+def bline_length_table(bline_list, bline_loop):
+    """
+    Calculates the length of every segment of the bline at a frame, along with
+    the cumulative arc-length table. This is computed once per frame and shared
+    by all the position conversions(hom_to_std and std_to_hom) at that frame
+
+    Args:
+        bline_list (list[common.BlinePoint.BlinePoint]): Synfig format bline list
+        bline_loop (Bool): Specifies if the bline is looped or not
+
+    Returns:
+        (dict): "curves" and "lengths" of the segments, "cumulative" lengths
+                (starting with 0.0) and the "total" length of the bline
+    """
+    table = {"curves": [], "lengths": [], "cumulative": [0.0], "total": 0.0}
     size = len(bline_list)
     if not bline_loop:  size -= 1
-    if size < 1:    return 0.0
-    tl = 0
+    if size < 1:    return table
 
     nxt = 0 # nxt = bline.begin()
     itr = 0
@@ -1286,12 +1272,13 @@ def bline_length(bline_list, bline_loop, lengths, fr):
                         blinepoint0.get_tangent2(),
                         blinepoint1.get_tangent1())
         l = curve.length()
-        if lengths is not None:
-            lengths.append(l)
-        tl += l
+        table["curves"].append(curve)
+        table["lengths"].append(l)
+        table["cumulative"].append(table["cumulative"][-1] + l)
         itr = nxt
         nxt += 1
-    return tl
+    table["total"] = table["cumulative"][-1]
+    return table
 
 def widthpoint_interpolate(prev, nxt, p, smoothness=0.0):
     """
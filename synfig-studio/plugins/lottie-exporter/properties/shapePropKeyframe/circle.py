@@ -8,8 +8,9 @@ import sys
 import math
 from common.Matrix2 import Matrix2
 from common.Vector import Vector
+from common.misc import clip_frame_window
 from synfig.animation import to_Synfig_axis
-from properties.shapePropKeyframe.helper import add, insert_dict_at, quadratic_to_cubic
+from properties.shapePropKeyframe.helper import add, gen_shape_keyframes, quadratic_to_cubic
 sys.path.append("../../")
 
 
@@ -30,6 +31,7 @@ def gen_list_circle(lottie, layer):
     window = {}
     window["first"] = sys.maxsize
     window["last"] = -1
+    window["waypoints"] = set()
 
     origin = layer.get_param("origin")
     radius = layer.get_param("radius")
@@ -42,24 +44,15 @@ def gen_list_circle(lottie, layer):
     radius.animate("real")
 
     # Minimizing the window size
-    if window["first"] == sys.maxsize and window["last"] == -1:
-        window["first"] = window["last"] = 0
+    clip_frame_window(window)
     ################# END OF SECTION 1 ###################
 
     ################ SECTION 2 ###########################
     # Generating values for all the frames in the window
-
-    fr = window["first"]
-    while fr <= window["last"]:
-        st_val, en_val = insert_dict_at(lottie, -1, fr, False)  # This loop needs to be considered somewhere down
-
+    def sample(st_val, fr):
         synfig_circle(st_val, origin, radius, fr)
-        synfig_circle(en_val, origin, radius, fr + 1)
 
-        fr += 1
-    # Setting the final time
-    lottie.append({})
-    lottie[-1]["t"] = fr
+    gen_shape_keyframes(lottie, window, False, sample)
 
 
 def synfig_circle(st_val, origin_param, radius_param, fr):
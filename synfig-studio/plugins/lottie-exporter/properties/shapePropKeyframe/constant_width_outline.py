@@ -7,7 +7,7 @@ in Lottie format without variable widths
 import sys
 import settings
 from common.Bline import Bline
-from common.misc import is_animated
+from common.misc import is_animated, clip_frame_window, gamma_correct
 from common.Count import Count
 from properties.value import gen_properties_value
 from properties.valueKeyframed import gen_value_Keyframed
@@ -63,7 +63,7 @@ def gen_bline_outline_constant(lottie, bline_point, layer, transformation, idx):
 		red = float(val[0].text)
 		green = float(val[1].text)
 		blue = float(val[2].text)
-		red, green, blue = red ** (1/settings.GAMMA[0]), green ** (1/settings.GAMMA[1]), blue ** (1/ settings.GAMMA[2])
+		red, green, blue = gamma_correct(red, 0), gamma_correct(green, 1), gamma_correct(blue, 2)
 		alpha = float(val[3].text)
 		gen_properties_value(lottie["it"][1]["c"],
 							[red, green, blue, alpha],
@@ -160,8 +160,7 @@ def gen_bline_outline_constant(lottie, bline_point, layer, transformation, idx):
 	homo_width.update_frame_window(window)
 	homo_width.animate_without_path("bool")
 	# Minimizing the window size
-	if window["first"] == sys.maxsize and window["last"] == -1:
-		window["first"] = window["last"] = 0
+	clip_frame_window(window)
 	
 	frames = list(set(settings.WAYPOINTS_LIST))
 	length = bline.get_len()
@@ -5,12 +5,16 @@ in Lottie format
 """
 
 import sys
+import math
+import multiprocessing
 import settings
 from common.misc import change_axis, radial_to_tangent
 from common.Vector import Vector
 from common.Param import Param
 sys.path.append("../../")
 
+frame_sampler = None    # function used by the workers of sample_frames()
+
 
 def animate_tangents(tangent, window):
     """
@@ -41,6 +45,124 @@ def animate_tangents(tangent, window):
     tangent.add_subparam("theta", theta)
 
 
+def get_samples(curve, samples, width=0.0):
+    """
+    Gives the number of pieces a curve should be subdivided into, so that the
+    sampled polyline(and its offset at `width`) does not deviate from the curve
+    by more than settings.FLATNESS_TOLERANCE pixels. The curve itself is bound
+    by Wang's formula on its control points. For the offset, the direction of
+    the curve is measured at the `samples` positions, and pieces are merged as
+    long as the arc of radius `width` they turn through stays flat enough
+
+    Args:
+        curve   (common.Hermite.Hermite) : Curve which is to be sampled
+        samples (float)                  : Maximum number of pieces, used as it is when the tolerance is 0
+        width   (:obj: `float`, optional): Distance of the offset curve(outline) from this curve
+
+    Returns:
+        (float) : Number of pieces for the parameter range [0, 1]
+    """
+    if settings.FLATNESS_TOLERANCE <= 0 or settings.PIX_PER_UNIT <= 0:
+        return samples
+
+    # Tolerance in Synfig units
+    tolerance = settings.FLATNESS_TOLERANCE / settings.PIX_PER_UNIT
+
+    flatness = max((curve.a - curve.b*2 + curve.c).mag(), (curve.b - curve.c*2 + curve.d).mag())
+    pieces = math.ceil(math.sqrt(0.75 * flatness / tolerance))
+    if pieces >= samples:
+        return samples
+
+    width = abs(width)
+    if width > tolerance:
+        # An arc of angle x and radius width deviates by width*x*x/8 from its chord
+        max_turn = math.sqrt(8 * tolerance / width)
+        total = int(math.ceil(samples))
+        turns = []
+        prev = None
+        for i in range(total + 1):
+            der = curve.derivative(min(i / total, 1.0))
+            if der.mag_squared() == 0:
+                continue
+            angle = math.atan2(der.val2, der.val1)
+            if prev is not None:
+                turns.append(abs((angle - prev + math.pi) % (2 * math.pi) - math.pi))
+            prev = angle
+        if turns and max(turns) > max_turn:
+            return samples
+
+        # Largest number of consecutive sample pieces which never turn too much
+        merge = 1
+        while merge < len(turns):
+            window = sum(turns[:merge+1])
+            worst = window
+            for k in range(merge+1, len(turns)):
+                window += turns[k] - turns[k-merge-1]
+                worst = max(worst, window)
+            if worst > max_turn:
+                break
+            merge += 1
+        pieces = max(pieces, math.ceil(total / merge))
+
+    return min(samples, max(1, pieces))
+
+
+def sample_frames(sample, first, last):
+    """
+    Calls sample(fr) for all the frames from first to last and returns the
+    results in order. If settings.JOBS allows, consecutive frames are given in
+    chunks to a pool of worker processes. The workers are forked, so they
+    already have all the parameters of the layer, and only the results are
+    sent back; these must be picklable
+
+    Args:
+        sample (function) : Computes the value of a single frame
+        first  (float)    : First frame
+        last   (float)    : Last frame
+
+    Returns:
+        (list) : Values returned by sample, for all the frames
+    """
+    # Frames below which a worker is not worth starting
+    MIN_FRAMES_PER_JOB = 10
+
+    global frame_sampler
+    # The frames can be floats, from the times of activepoints or converts
+    frames = []
+    fr = first
+    while fr <= last:
+        frames.append(fr)
+        fr += 1
+    jobs = settings.JOBS
+    if jobs <= 0:
+        jobs = multiprocessing.cpu_count()
+    jobs = min(jobs, len(frames) // MIN_FRAMES_PER_JOB)
+    if jobs <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return [sample(fr) for fr in frames]
+
+    # A few chunks per worker balance the load, while keeping the frames of a
+    # chunk together for the per frame caches
+    size = -(-len(frames) // (jobs * 4))
+    chunks = [frames[itr:itr+size] for itr in range(0, len(frames), size)]
+
+    frame_sampler = sample
+    try:
+        with multiprocessing.get_context("fork").Pool(jobs) as pool:
+            ret = []
+            for values in pool.imap(sample_frame_chunk, chunks):
+                ret.extend(values)
+    finally:
+        frame_sampler = None
+    return ret
+
+
+def sample_frame_chunk(chunk):
+    """
+    Runs in a worker process of sample_frames(), and samples a chunk of frames
+    """
+    return [frame_sampler(fr) for fr in chunk]
+
+
 def update_child_at_parent(parent, new_child, tag, param_name=None):
     """
     Given a node, replaces the child with tag `tag` with new_child
@@ -255,6 +377,135 @@ def insert_dict_at(lottie, idx, fr, loop, constant=False):
         return st_val, en_val
 
 
+def gen_shape_keyframes(lottie, window, loop, sample):
+    """
+    Generates the keyframes of a parametric shape(circle, rectangle, star,
+    polygon). The window is cut at the waypoints of the parameters, and each
+    piece becomes a single keyframe if the shape at all of its frames is the
+    shape at its start, moved towards the shape at its end by a common cubic
+    easing: this is what an animated param does in Synfig when the vertices
+    depend linearly on it. Otherwise, e.g. for rotations or convert methods,
+    the piece gets a keyframe at every frame
+
+    Args:
+        lottie (dict)     : Lottie format keyframes will be stored in this
+        window (dict)     : First and last frame, and the frames of the waypoints in "waypoints"
+        loop   (bool)     : Specifies if the shape is loop or not
+        sample (function) : sample(st_val, fr) stores the Lottie shape at frame fr in st_val
+
+    Returns:
+        (None)
+    """
+    first = window["first"]
+    count = int(window["last"] - first) + 1
+
+    # Offsets from the first frame, at which the shape is cut
+    cuts = {0, count}
+    for fr in window.get("waypoints", []):
+        for cut in (math.floor(fr - first), math.ceil(fr - first)):
+            if 0 < cut < count:
+                cuts.add(cut)
+    cuts = sorted(cuts)
+
+    shapes = {}
+    def shape_at(itr):
+        if itr not in shapes:
+            shapes[itr] = {"i": [], "o": [], "v": [], "c": loop}
+            sample(shapes[itr], first + itr)
+        return shapes[itr]
+
+    def set_shape(val, shape):
+        for key in ("i", "o", "v"):
+            val[key].extend([list(pt) for pt in shape[key]])
+
+    for start, end in zip(cuts, cuts[1:]):
+        easing = get_shape_easing([shape_at(itr) for itr in range(start, end + 1)])
+        if easing is not None:
+            st_val, en_val = insert_dict_at(lottie, -1, first + start, loop)
+            set_shape(st_val, shape_at(start))
+            set_shape(en_val, shape_at(end))
+            if end - start > 1:
+                lottie[-1]["o"]["x"], lottie[-1]["o"]["y"] = 1/3.0, easing[0]
+                lottie[-1]["i"]["x"], lottie[-1]["i"]["y"] = 2/3.0, easing[1]
+        else:
+            for itr in range(start, end):
+                st_val, en_val = insert_dict_at(lottie, -1, first + itr, loop)
+                set_shape(st_val, shape_at(itr))
+                set_shape(en_val, shape_at(itr + 1))
+        # Shapes before this piece are not needed anymore
+        for itr in range(start, end):
+            shapes.pop(itr, None)
+
+    # Setting the final time
+    lottie.append({})
+    lottie[-1]["t"] = first + count
+
+
+def get_shape_easing(shapes):
+    """
+    Finds y1, y2 such that each of the shapes is
+    shapes[0] + (shapes[-1] - shapes[0]) * B(u), where u goes linearly from 0
+    to 1 over the shapes and B is the cubic with control values 0, y1, y2, 1.
+    This is the Lottie easing with control points (1/3, y1), (2/3, y2), whose
+    x is linear in time
+
+    Args:
+        shapes (list[dict]) : Lottie shapes at consecutive frames
+
+    Returns:
+        (tuple | None) : (y1, y2), or None if the shapes do not move this way
+    """
+    # The sampled points are rounded in Synfig units at every step, so they
+    # only follow the exact motion up to some noise
+    max_error = settings.SHAPE_EASING_TOLERANCE
+
+    def flatten(shape):
+        return [val for key in ("i", "o", "v") for pt in shape[key] for val in pt]
+
+    start, end = flatten(shapes[0]), flatten(shapes[-1])
+    num = len(shapes) - 1
+    diff = [e - s for s, e in zip(start, end)]
+    diff_sq = sum(d*d for d in diff)
+    middle = []
+    for itr in range(1, num):
+        cur = flatten(shapes[itr])
+        if len(cur) != len(start) or shapes[itr]["c"] != shapes[0]["c"]:
+            return None
+        middle.append((itr / float(num), cur))
+    if len(end) != len(start) or shapes[-1]["c"] != shapes[0]["c"]:
+        return None
+
+    if diff_sq == 0:
+        y1, y2 = 1/3.0, 2/3.0
+    else:
+        # Least squares fit of y1, y2 to the progress of the middle shapes
+        a11 = a12 = a22 = r1 = r2 = 0.0
+        for u, cur in middle:
+            progress = sum((c - s)*d for s, c, d in zip(start, cur, diff)) / diff_sq
+            b1, b2 = 3*(1-u)*(1-u)*u, 3*(1-u)*u*u
+            rem = progress - u*u*u
+            a11 += b1*b1
+            a12 += b1*b2
+            a22 += b2*b2
+            r1 += b1*rem
+            r2 += b2*rem
+        det = a11*a22 - a12*a12
+        if len(middle) >= 2 and abs(det) > 1e-12:
+            y1 = (r1*a22 - r2*a12) / det
+            y2 = (a11*r2 - a12*r1) / det
+        elif middle:
+            y1 = y2 = (r1 + r2) / (a11 + 2*a12 + a22)
+        else:
+            y1, y2 = 1/3.0, 2/3.0
+
+    for u, cur in middle:
+        eased = 3*(1-u)*(1-u)*u*y1 + 3*(1-u)*u*u*y2 + u*u*u
+        for s, c, d in zip(start, cur, diff):
+            if abs(s + d*eased - c) > max_error:
+                return None
+    return y1, y2
+
+
 def insert_dict_at_adv_outline(lottie, idx, fr, loop):
     """
     Inserts dictionary values in the main dictionary, required by shape layer of
@@ -308,3 +559,348 @@ def quadratic_to_cubic(qp0, qp1, qp2):
     cp1 = qp0 + 2/3.0*(qp1 - qp0)
     cp2 = qp2 + 2/3.0*(qp1 - qp2)
     return cp1, cp2
+
+
+def simplify_shape(shape, tolerance):
+    """
+    Removes the vertices of a straight edged(all tangents zero) Lottie shape
+    which lie within tolerance of the polyline through the remaining vertices,
+    using Douglas-Peucker. Shapes having curved edges are left untouched
+
+    Args:
+        shape     (dict)  : Lottie shape having "i", "o" and "v" lists
+        tolerance (float) : Maximum distance(in pixels) of a removed vertex from the new polyline
+
+    Returns:
+        (None)
+    """
+    vertices = shape["v"]
+    if len(vertices) < 3:
+        return
+    for tangent in shape["i"] + shape["o"]:
+        if tangent[0] != 0 or tangent[1] != 0:
+            return
+
+    keep = [False] * len(vertices)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(vertices) - 1)]
+    while stack:
+        first, last = stack.pop()
+        ax, ay = vertices[first]
+        dx, dy = vertices[last][0] - ax, vertices[last][1] - ay
+        length = dx*dx + dy*dy
+        farthest, far_itr = -1.0, -1
+        for itr in range(first + 1, last):
+            px, py = vertices[itr][0] - ax, vertices[itr][1] - ay
+            if length == 0:
+                dist = px*px + py*py
+            else:
+                t = min(max((px*dx + py*dy) / length, 0.0), 1.0)
+                dist = (px - t*dx)**2 + (py - t*dy)**2
+            if dist > farthest:
+                farthest, far_itr = dist, itr
+        if farthest > tolerance * tolerance:
+            keep[far_itr] = True
+            stack.append((first, far_itr))
+            stack.append((far_itr, last))
+
+    for key in ("i", "o", "v"):
+        shape[key] = [val for val, kept in zip(shape[key], keep) if kept]
+
+
+def split_shape_edges(shape, count):
+    """
+    Adds count vertices to a Lottie shape without changing its geometry. The
+    vertices are spread over the edges in proportion to their lengths, so the
+    same vertex of different frames lies at about the same place on the shape
+
+    Args:
+        shape (dict) : Lottie shape having "i", "o", "v" and "c"
+        count (int)  : Number of vertices to be added
+
+    Returns:
+        (None)
+    """
+    if count <= 0:
+        return
+    size = len(shape["v"])
+    num_edges = size if shape["c"] else size - 1
+
+    # Control points of the edges, and the length of their control polygon
+    edges = []
+    lengths = []
+    for itr in range(num_edges):
+        nxt = (itr + 1) % size
+        p0, p3 = shape["v"][itr], shape["v"][nxt]
+        p1 = [p0[0] + shape["o"][itr][0], p0[1] + shape["o"][itr][1]]
+        p2 = [p3[0] + shape["i"][nxt][0], p3[1] + shape["i"][nxt][1]]
+        edges.append((p0, p1, p2, p3))
+        lengths.append(math.hypot(p1[0]-p0[0], p1[1]-p0[1]) + math.hypot(p2[0]-p1[0], p2[1]-p1[1]) + math.hypot(p3[0]-p2[0], p3[1]-p2[1]))
+
+    # Number of vertices to be added in each edge, largest remainder first
+    total = sum(lengths)
+    if num_edges == 0 or total == 0:
+        # Degenerate shape, repeat its last vertex
+        for key in ("i", "o", "v"):
+            shape[key].extend([list(shape[key][-1]) for i in range(count)])
+        return
+    shares = [count * length / total for length in lengths]
+    splits = [int(share) for share in shares]
+    order = sorted(range(num_edges), key=lambda itr: splits[itr] - shares[itr])
+    for itr in order[:count - sum(splits)]:
+        splits[itr] += 1
+
+    new_i, new_o, new_v = [], [], []
+    for itr in range(size):
+        new_i.append(shape["i"][itr])
+        new_o.append(shape["o"][itr])
+        new_v.append(shape["v"][itr])
+        if itr >= num_edges or splits[itr] == 0:
+            continue
+        p0, p1, p2, p3 = edges[itr]
+        straight = p1 == p0 and p2 == p3
+        pieces = splits[itr] + 1
+        for piece in range(1, pieces):
+            if straight:
+                t = piece / pieces
+                new_i.append([0, 0])
+                new_o.append([0, 0])
+                new_v.append([p0[0] + (p3[0]-p0[0])*t, p0[1] + (p3[1]-p0[1])*t])
+                continue
+            # Split the remaining curve so that all the pieces are equal in parameter
+            t = 1.0 / (pieces - piece + 1)
+            a = [p0[k] + (p1[k]-p0[k])*t for k in range(2)]
+            b = [p1[k] + (p2[k]-p1[k])*t for k in range(2)]
+            c = [p2[k] + (p3[k]-p2[k])*t for k in range(2)]
+            ab = [a[k] + (b[k]-a[k])*t for k in range(2)]
+            bc = [b[k] + (c[k]-b[k])*t for k in range(2)]
+            mid = [ab[k] + (bc[k]-ab[k])*t for k in range(2)]
+            new_o[-1] = [a[0] - p0[0], a[1] - p0[1]]
+            new_i.append([ab[0] - mid[0], ab[1] - mid[1]])
+            new_o.append([bc[0] - mid[0], bc[1] - mid[1]])
+            new_v.append(mid)
+            p0, p1, p2 = mid, bc, c
+        if not straight:
+            # In tangent of the vertex ending this edge
+            nxt = (itr + 1) % size
+            tangent = [p2[0] - p3[0], p2[1] - p3[1]]
+            if nxt == 0:
+                new_i[0] = tangent
+            else:
+                shape["i"][nxt] = tangent
+
+    shape["i"], shape["o"], shape["v"] = new_i, new_o, new_v
+
+
+def fit_side(side):
+    """
+    Replaces a sampled polyline(all tangents zero) of an outline by a few
+    cubic bezier curves, using Schneider's algorithm: "An Algorithm for
+    Automatically Fitting Digitized Curves", Graphics Gems 1990.
+    The polyline is first broken at its corners, so that cusps and tips stay
+    sharp, and then every smooth run is fitted within
+    settings.FLATNESS_TOLERANCE pixels
+
+    Args:
+        side (list[(common.Vector.Vector, common.Vector.Vector, common.Vector.Vector)]) : Points, tangent1 and tangent2 of the outline
+
+    Returns:
+        (list[(common.Vector.Vector, common.Vector.Vector, common.Vector.Vector)]) : Fitted points, tangent1 and tangent2
+    """
+    # Turn(in radians) between two edges above which the point is a corner
+    CORNER_ANGLE = math.pi / 6
+
+    if settings.FLATNESS_TOLERANCE <= 0 or settings.PIX_PER_UNIT <= 0 or len(side) < 3:
+        return side
+
+    # Tolerance in Synfig units
+    tolerance = settings.FLATNESS_TOLERANCE / settings.PIX_PER_UNIT
+
+    # Remove the repeated points
+    points = [[side[0][0].val1, side[0][0].val2]]
+    for item in side[1:]:
+        if abs(item[0].val1 - points[-1][0]) + abs(item[0].val2 - points[-1][1]) > 1e-9:
+            points.append([item[0].val1, item[0].val2])
+    if len(points) < 3:
+        return side
+
+    ret = [[Vector(points[0][0], points[0][1]), Vector(0, 0), Vector(0, 0)]]
+    cos_corner = math.cos(CORNER_ANGLE)
+    first = 0
+    for itr in range(1, len(points)):
+        if itr < len(points) - 1:
+            ax, ay = points[itr][0] - points[itr-1][0], points[itr][1] - points[itr-1][1]
+            bx, by = points[itr+1][0] - points[itr][0], points[itr+1][1] - points[itr][1]
+            cos_turn = (ax*bx + ay*by) / math.sqrt((ax*ax + ay*ay) * (bx*bx + by*by))
+            if cos_turn > cos_corner:
+                continue
+        # Fit the smooth run from first to itr
+        run = points[first:itr+1]
+        beziers = []
+        if len(run) == 2:
+            beziers.append([run[0], run[0], run[1], run[1]])
+        else:
+            fit_cubic(run, 0, len(run) - 1, unit_vector(run[0], run[1]), unit_vector(run[-1], run[-2]), tolerance, beziers)
+        for bez in beziers:
+            ret[-1][2] = Vector(bez[1][0] - bez[0][0], bez[1][1] - bez[0][1])
+            ret.append([Vector(bez[3][0], bez[3][1]), Vector(bez[3][0] - bez[2][0], bez[3][1] - bez[2][1]), Vector(0, 0)])
+        first = itr
+    return ret
+
+
+def unit_vector(p1, p2):
+    """
+    Returns the unit vector from p1 towards p2, as a list
+    """
+    dx, dy = p2[0] - p1[0], p2[1] - p1[1]
+    length = math.sqrt(dx*dx + dy*dy)
+    if length == 0:
+        return [0.0, 0.0]
+    return [dx / length, dy / length]
+
+
+def bezier_at(bez, t):
+    """
+    Returns the point at parameter t of a cubic bezier, as a list
+    """
+    mt = 1 - t
+    b0, b1, b2, b3 = mt*mt*mt, 3*mt*mt*t, 3*mt*t*t, t*t*t
+    return [b0*bez[0][k] + b1*bez[1][k] + b2*bez[2][k] + b3*bez[3][k] for k in range(2)]
+
+
+def fit_cubic(points, first, last, tan1, tan2, tolerance, beziers):
+    """
+    Fits cubic beziers to points[first..last] and appends them to beziers.
+    Whenever a single curve is not close enough even after reparameterizing,
+    the points are split at the worst point and both halves are fitted
+
+    Args:
+        points    (list[list[float]]) : Points to be fitted
+        first     (int)               : Index of the first point
+        last      (int)               : Index of the last point
+        tan1      (list[float])       : Unit tangent at the first point, pointing inside
+        tan2      (list[float])       : Unit tangent at the last point, pointing inside
+        tolerance (float)             : Maximum allowed distance of a point from the curve
+        beziers   (list)              : Fitted curves [p0, p1, p2, p3] are appended here
+
+    Returns:
+        (None)
+    """
+    MAX_ITERATIONS = 4
+
+    p0, p3 = points[first], points[last]
+    if last - first == 1:
+        dist = math.hypot(p3[0] - p0[0], p3[1] - p0[1]) / 3.0
+        beziers.append([p0, [p0[0] + tan1[0]*dist, p0[1] + tan1[1]*dist], [p3[0] + tan2[0]*dist, p3[1] + tan2[1]*dist], p3])
+        return
+
+    # Chord length parameterization
+    params = [0.0]
+    for itr in range(first + 1, last + 1):
+        params.append(params[-1] + math.hypot(points[itr][0] - points[itr-1][0], points[itr][1] - points[itr-1][1]))
+    for itr in range(len(params)):
+        params[itr] /= params[-1]
+
+    tolerance_sq = tolerance * tolerance
+    for iteration in range(MAX_ITERATIONS + 1):
+        bez = generate_bezier(points, first, last, params, tan1, tan2)
+        max_error, split = max_fit_error(points, first, last, bez, params)
+        if max_error < tolerance_sq:
+            beziers.append(bez)
+            return
+        # Only try to improve the parameters if the fit is close
+        if max_error > 4 * tolerance_sq or iteration == MAX_ITERATIONS:
+            break
+        params = [newton_raphson(bez, points[first + itr], params[itr]) for itr in range(len(params))]
+
+    # Fitting failed, split at the point of max error and fit recursively
+    center = unit_vector(points[split+1], points[split-1])
+    if center == [0.0, 0.0]:
+        center = [-tan1[1], tan1[0]]
+    fit_cubic(points, first, split, tan1, center, tolerance, beziers)
+    fit_cubic(points, split, last, [-center[0], -center[1]], tan2, tolerance, beziers)
+
+
+def generate_bezier(points, first, last, params, tan1, tan2):
+    """
+    Finds the lengths of the end tangents of a cubic bezier so that it fits
+    points[first..last] at the given parameters in the least squares sense
+
+    Args:
+        points (list[list[float]]) : Points to be fitted
+        first  (int)               : Index of the first point
+        last   (int)               : Index of the last point
+        params (list[float])       : Parameter of each of the point on the curve
+        tan1   (list[float])       : Unit tangent at the first point
+        tan2   (list[float])       : Unit tangent at the last point
+
+    Returns:
+        (list[list[float]]) : Control points of the curve
+    """
+    p0, p3 = points[first], points[last]
+    c00 = c01 = c11 = x0 = x1 = 0.0
+    for itr, t in enumerate(params):
+        mt = 1 - t
+        b0, b1, b2, b3 = mt*mt*mt, 3*mt*mt*t, 3*mt*t*t, t*t*t
+        a1 = [tan1[0]*b1, tan1[1]*b1]
+        a2 = [tan2[0]*b2, tan2[1]*b2]
+        c00 += a1[0]*a1[0] + a1[1]*a1[1]
+        c01 += a1[0]*a2[0] + a1[1]*a2[1]
+        c11 += a2[0]*a2[0] + a2[1]*a2[1]
+        point = points[first + itr]
+        tmp = [point[k] - (p0[k]*(b0 + b1) + p3[k]*(b2 + b3)) for k in range(2)]
+        x0 += a1[0]*tmp[0] + a1[1]*tmp[1]
+        x1 += a2[0]*tmp[0] + a2[1]*tmp[1]
+
+    det = c00*c11 - c01*c01
+    alpha1 = alpha2 = 0.0
+    if abs(det) > 1e-12:
+        alpha1 = (x0*c11 - x1*c01) / det
+        alpha2 = (c00*x1 - c01*x0) / det
+
+    # Fall back to the heuristic of Wu/Barsky if the solution is degenerate
+    seg_length = math.hypot(p3[0] - p0[0], p3[1] - p0[1])
+    epsilon = 1e-6 * seg_length
+    if alpha1 < epsilon or alpha2 < epsilon:
+        alpha1 = alpha2 = seg_length / 3.0
+
+    return [p0, [p0[0] + tan1[0]*alpha1, p0[1] + tan1[1]*alpha1], [p3[0] + tan2[0]*alpha2, p3[1] + tan2[1]*alpha2], p3]
+
+
+def max_fit_error(points, first, last, bez, params):
+    """
+    Returns the maximum squared distance of the points(and the middle of the
+    edges joining them, so that long edges are not bent) from the curve at
+    their parameters, and the index of the point where it occurs
+    """
+    max_error, split = 0.0, (first + last) // 2
+    for itr in range(first + 1, last + 1):
+        t = (params[itr - first - 1] + params[itr - first]) / 2
+        point = bezier_at(bez, t)
+        middle = [(points[itr-1][0] + points[itr][0]) / 2, (points[itr-1][1] + points[itr][1]) / 2]
+        error = (point[0] - middle[0])**2 + (point[1] - middle[1])**2
+        if error >= max_error:
+            max_error, split = error, (itr if itr < last else itr - 1)
+        if itr == last:
+            break
+        point = bezier_at(bez, params[itr - first])
+        error = (point[0] - points[itr][0])**2 + (point[1] - points[itr][1])**2
+        if error >= max_error:
+            max_error, split = error, itr
+    return max_error, split
+
+
+def newton_raphson(bez, point, t):
+    """
+    Improves the parameter t of a point, so that the curve at t is closer to it
+    """
+    mt = 1 - t
+    q = bezier_at(bez, t)
+    q1 = [3*(mt*mt*(bez[1][k] - bez[0][k]) + 2*mt*t*(bez[2][k] - bez[1][k]) + t*t*(bez[3][k] - bez[2][k])) for k in range(2)]
+    q2 = [6*(mt*(bez[2][k] - 2*bez[1][k] + bez[0][k]) + t*(bez[3][k] - 2*bez[2][k] + bez[1][k])) for k in range(2)]
+    diff = [q[0] - point[0], q[1] - point[1]]
+    numerator = diff[0]*q1[0] + diff[1]*q1[1]
+    denominator = q1[0]*q1[0] + q1[1]*q1[1] + diff[0]*q2[0] + diff[1]*q2[1]
+    if denominator == 0:
+        return t
+    return t - numerator / denominator
@@ -6,13 +6,13 @@ in Lottie format
 
 import sys
 import math
-import copy
 import settings
 from common.Bline import Bline
+from common.misc import clip_frame_window
 from common.Vector import Vector
 from common.Hermite import Hermite
 from synfig.animation import to_Synfig_axis
-from properties.shapePropKeyframe.helper import add_reverse, add, move_to, insert_dict_at, animate_tangents
+from properties.shapePropKeyframe.helper import add_reverse, add, move_to, insert_dict_at, animate_tangents, get_samples, simplify_shape, split_shape_edges, fit_side, sample_frames
 sys.path.append("../../")
 
 
@@ -108,22 +108,27 @@ def gen_bline_outline(lottie, bline_point):
     homo_width.animate_without_path("bool")
 
     # Minimizing the window size
-    if window["first"] == sys.maxsize and window["last"] == -1:
-        window["first"] = window["last"] = 0
+    clip_frame_window(window)
     ################# END OF SECTION 1 ###################
 
     ################ SECTION 2 ###########################
     # Generating values for all the frames in the window
 
 
+    def sample(fr):
+        st_val, en_val = insert_dict_at([], -1, fr, False)
+        synfig_outline(bline, st_val, origin, outer_width, sharp_cusps, expand, r_tip0, r_tip1, homo_width, fr)
+        synfig_outline(bline, en_val, origin, outer_width, sharp_cusps, expand, r_tip0, r_tip1, homo_width, fr + 1)
+        return st_val, en_val
+
     lottie_st_list, lottie_en_list = [], []
     fr = window["first"]
-    while fr <= window["last"]:
+    for st_sample, en_sample in sample_frames(sample, window["first"], window["last"]):
         st_val, en_val = insert_dict_at(lottie, -1, fr, False)  # This loop needs to be considered somewhere down
+        st_val.update(st_sample)
+        en_val.update(en_sample)
         lottie_st_list.append(st_val)
         lottie_en_list.append(en_val)
-        synfig_outline(bline, st_val, origin, outer_width, sharp_cusps, expand, r_tip0, r_tip1, homo_width, fr)
-        synfig_outline(bline, en_val, origin, outer_width, sharp_cusps, expand, r_tip0, r_tip1, homo_width, fr + 1)
         fr += 1
     equalize_length(lottie_st_list, lottie_en_list)
     # Setting the final time
@@ -134,43 +139,58 @@ def gen_bline_outline(lottie, bline_point):
 def equalize_length(lottie_st, lottie_en):
     """
     This fxn collects all the lists needed to render the outline, and makes them
-    of equal length by adding dummy points: This is a requirement of Lottie
+    of equal length: This is a requirement of Lottie, the player takes the
+    number of vertices from the first keyframe. The straight edged frames are
+    first simplified within settings.FLATNESS_TOLERANCE, so that a single frame
+    with many vertices does not inflate all the others as much. Then the extra
+    vertices are added by splitting the edges of the shorter frames
     """
+    shapes = lottie_st + lottie_en
+    if settings.FLATNESS_TOLERANCE > 0:
+        for shape in shapes:
+            simplify_shape(shape, settings.FLATNESS_TOLERANCE)
+
     # Find maximum among the lists
     mx = 0
-    for st in lottie_st:
-        mx = max(mx, len(st["i"]))
-    for en in lottie_en:
-        mx = max(mx, len(en["i"]))
-
-    for st in lottie_st:
-        diff = mx - len(st["i"])
-        last_value_i, lv_o, lv_v = copy.deepcopy(st["i"][-1]), copy.deepcopy(st["o"][-1]), copy.deepcopy(st["v"][-1])
-        st["i"].extend([last_value_i for i in range(diff)])
-        st["o"].extend([lv_o for i in range(diff)])
-        st["v"].extend([lv_v for i in range(diff)])
-
-    for st in lottie_en:
-        diff = mx - len(st["i"])
-        last_value_i, lv_o, lv_v = copy.deepcopy(st["i"][-1]), copy.deepcopy(st["o"][-1]), copy.deepcopy(st["v"][-1])
-        st["i"].extend([last_value_i for i in range(diff)])
-        st["o"].extend([lv_o for i in range(diff)])
-        st["v"].extend([lv_v for i in range(diff)])
+    for shape in shapes:
+        mx = max(mx, len(shape["v"]))
+
+    for shape in shapes:
+        split_shape_edges(shape, mx - len(shape["v"]))
 
 
 def get_outline_grow(fr):
     """
     Gives the value of outline grow parameter at a particular frame
     """
-    ret = 0
-    for og in settings.OUTLINE_GROW:
-        if isinstance(og, (float, int)):
-            ret += og
-        else:   # should be dict
-            val = to_Synfig_axis(og.get_value(fr), "real")
-            ret += val
-    ret = math.e ** ret
-    return ret
+    return get_outline_grow_at_level(len(settings.OUTLINE_GROW) - 1, fr)[1]
+
+
+def get_outline_grow_at_level(level, fr):
+    """
+    Gives the sum of the outline grow params of the groups up to a nesting
+    level, and the grow factor made from it. Both are stored in the level, so
+    that they are computed once for all the outlines inside the group; and
+    only once for all the frames if no param up to this level is animated
+
+    Args:
+        level (int) : Index of the group in settings.OUTLINE_GROW
+        fr    (int) : Frame number
+
+    Returns:
+        (float) : Sum of the outline grow params
+        (float) : Outline grow factor
+    """
+    og = settings.OUTLINE_GROW[level]
+    key = None if og["constant"] else fr
+    if key not in og["values"]:
+        ret = 0
+        if level:
+            ret = get_outline_grow_at_level(level - 1, fr)[0]
+        if og["param"] is not None:
+            ret += to_Synfig_axis(og["param"].get_value(fr), "real")
+        og["values"][key] = (ret, math.e ** ret)
+    return og["values"][key]
 
 
 def synfig_outline(bline, st_val, origin_p, outer_width_p, sharp_cusps_p, expand_p, r_tip0_p, r_tip1_p, homo_width_p, fr):
@@ -195,7 +215,6 @@ def synfig_outline(bline, st_val, origin_p, outer_width_p, sharp_cusps_p, expand
     """
 
     EPSILON = 0.000000001
-    SAMPLES = 50
     CUSP_TANGENT_ADJUST = 0.025
     CUSP_THRESHOLD = 0.40
     SPIKE_AMOUNT = 4
@@ -310,6 +329,7 @@ def synfig_outline(bline, st_val, origin_p, outer_width_p, sharp_cusps_p, expand
                 side_b.append([bp1.get_vertex() - (t1 + t2).norm()*iter_w*amount, Vector(0, 0), Vector(0, 0)])
 
         # Precalculate positions and coefficients
+        samples = get_samples(curve, settings.SAMPLES, max(abs(iter_w), abs(next_w)))
         length = 0.0
         points = []
         dists = []
@@ -321,7 +341,7 @@ def synfig_outline(bline, st_val, origin_p, outer_width_p, sharp_cusps_p, expand
                 length += (points[itr] - points[itr-1]).mag()
             dists.append(length)
 
-            n += 1.0/SAMPLES
+            n += 1.0/samples
             itr += 1
         length += (curve.value(1) - points[itr-1]).mag()
 
@@ -329,9 +349,7 @@ def synfig_outline(bline, st_val, origin_p, outer_width_p, sharp_cusps_p, expand
         if length > EPSILON:
             div_length = 1.0 / length
 
-        # Might not need /3 for the tangents generated finally - VERY IMPORTANT
         # Make the outline
-        pt = curve.derivative(CUSP_TANGENT_ADJUST) / 3
         n = 0.0
         itr = 0
         while n < 1.000001:
@@ -341,23 +359,10 @@ def synfig_outline(bline, st_val, origin_p, outer_width_p, sharp_cusps_p, expand
             if not homo_width:
                 k = n
             w = (next_w - iter_w)*k + iter_w
-            if False and n:
-                # create curve
-                a = points[itr-1] + d*w
-                b = points[itr] + d*w
-                tk = (b - a).mag() * div_length
-                side_a.append([b, pt*tk, -t*tk])
-
-                a = points[itr-1] - d*w
-                b = points[itr] - d*w
-                tk = (b - a).mag() * div_length
-                side_b.append([b, pt*tk, -t*tk])
-            else:
-                side_a.append([points[itr] + d*w, Vector(0, 0), Vector(0, 0)])
-                side_b.append([points[itr] - d*w, Vector(0, 0), Vector(0, 0)])
-            pt = t
+            side_a.append([points[itr] + d*w, Vector(0, 0), Vector(0, 0)])
+            side_b.append([points[itr] - d*w, Vector(0, 0), Vector(0, 0)])
             itr += 1
-            n += 1.0/SAMPLES
+            n += 1.0/samples
 
         last_tangent = curve.derivative(1.0 - CUSP_TANGENT_ADJUST)
         side_a.append([curve.value(1.0) + last_tangent.perp().norm()*next_w, Vector(0, 0), Vector(0, 0)])
@@ -371,6 +376,10 @@ def synfig_outline(bline, st_val, origin_p, outer_width_p, sharp_cusps_p, expand
     if len(side_a) < 2 or len(side_b) < 2:
         return
 
+    # Turn the sampled polylines back into curves, side_b is drawn in reverse
+    side_a = fit_side(side_a)
+    side_b = fit_side(side_b[::-1])[::-1]
+
     origin_cur = origin_p.get_value(fr)
     move_to(side_a[0][0], st_val, origin_cur)
 
@@ -392,7 +401,7 @@ def synfig_outline(bline, st_val, origin_p, outer_width_p, sharp_cusps_p, expand
             tan = tangent*w*(ROUND_END_FACTOR/3.0)
 
             # replace the last point
-            side_a[-1] = [a, Vector(0, 0), tan]
+            side_a[-1] = [a, side_a[-1][1], tan]
             add(side_a, st_val, origin_cur)
             add([[b, -tan, Vector(0, 0)]], st_val, origin_cur)
         else:
@@ -412,7 +421,7 @@ def synfig_outline(bline, st_val, origin_p, outer_width_p, sharp_cusps_p, expand
             tan = -tangent*w*(ROUND_END_FACTOR/3.0)
 
             # replace the first point
-            side_b[0] = [a, Vector(0, 0), tan]
+            side_b[0] = [a, side_b[0][1], tan]
             add_reverse(side_b, st_val, origin_cur)
             add([[b, -tan, Vector(0, 0)]], st_val, origin_cur)
         else:
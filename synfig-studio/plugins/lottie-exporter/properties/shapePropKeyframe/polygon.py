@@ -8,7 +8,8 @@ import sys
 from common.Vector import Vector
 from common.Bline import Bline
 from common.Param import Param
-from properties.shapePropKeyframe.helper import insert_dict_at
+from common.misc import clip_frame_window
+from properties.shapePropKeyframe.helper import gen_shape_keyframes
 sys.path.append("../../")
 
 
@@ -29,6 +30,7 @@ def gen_dynamic_list_polygon(lottie, dynamic_list):
     window = {}
     window["first"] = sys.maxsize
     window["last"] = -1
+    window["waypoints"] = set()
     dynamic_list = Bline(dynamic_list[0], dynamic_list)
 
     for entry in dynamic_list.get_entry_list():
@@ -46,39 +48,40 @@ def gen_dynamic_list_polygon(lottie, dynamic_list):
     origin.update_frame_window(window)
     origin.animate("vector")
 
-    if window["first"] == sys.maxsize and window["last"] == -1:
-        window["first"] = window["last"] = 0
+    # Minimizing the window size
+    clip_frame_window(window)
     ################ END OF SECTION 1 ##############
 
     ################ SECTION 2 #####################
     # Generating values for all the frames in the window
-    fr = window["first"]
-    while fr <= window["last"]:
-        st_val, en_val = insert_dict_at(lottie, -1, fr, False)
-
-        for entry in dynamic_list.get_entry_list():
-            pos_cur = entry["vector"].get_value(fr)
-            pos_next = entry["vector"].get_value(fr + 1)
-
-            tangent1_cur, tangent2_cur = Vector(0, 0), Vector(0, 0)
-            tangent1_next, tangent2_next = Vector(0, 0), Vector(0, 0)
-
-            # Adding origin to each vertex
-            origin_cur = origin.get_value(fr)
-            origin_next = origin.get_value(fr + 1)
-            for i in range(len(pos_cur)):
-                pos_cur[i] += origin_cur[i]
-            for i in range(len(pos_next)):
-                pos_next[i] += origin_next[i]
-
-            # Store values in dictionary
-            st_val["i"].append(tangent1_cur.get_list())
-            st_val["o"].append(tangent2_cur.get_list())
-            st_val["v"].append(pos_cur)
-            en_val["i"].append(tangent1_next.get_list())
-            en_val["o"].append(tangent2_next.get_list())
-            en_val["v"].append(pos_next)
-        fr += 1
-    # Setting the final time
-    lottie.append({})
-    lottie[-1]["t"] = fr
+    def sample(st_val, fr):
+        synfig_polygon(st_val, dynamic_list, origin, fr)
+
+    gen_shape_keyframes(lottie, window, False, sample)
+
+
+def synfig_polygon(st_val, dynamic_list, origin_p, fr):
+    """
+    Calculates the points for the polygon layer at a frame
+
+    Args:
+        st_val       (dict)               : Lottie format polygon will be stored in this
+        dynamic_list (common.Bline.Bline) : Synfig format points of polygon
+        origin_p     (common.Param.Param) : Lottie format origin of polygon
+        fr           (int)                : Frame number
+
+    Returns:
+        (None)
+    """
+    # Adding origin to each vertex
+    origin_cur = origin_p.get_value(fr)
+    for entry in dynamic_list.get_entry_list():
+        pos_cur = entry["vector"].get_value(fr)
+        tangent1_cur, tangent2_cur = Vector(0, 0), Vector(0, 0)
+        for i in range(len(pos_cur)):
+            pos_cur[i] += origin_cur[i]
+
+        # Store values in dictionary
+        st_val["i"].append(tangent1_cur.get_list())
+        st_val["o"].append(tangent2_cur.get_list())
+        st_val["v"].append(pos_cur)
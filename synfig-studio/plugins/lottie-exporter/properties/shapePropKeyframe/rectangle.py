@@ -6,10 +6,10 @@ in Lottie format
 
 import sys
 from lxml import etree
-from common.misc import approximate_equal
+from common.misc import approximate_equal, clip_frame_window
 from common.Vector import Vector
 from synfig.animation import to_Synfig_axis
-from properties.shapePropKeyframe.helper import add, insert_dict_at, quadratic_to_cubic
+from properties.shapePropKeyframe.helper import add, gen_shape_keyframes, quadratic_to_cubic
 sys.path.append("../../")
 
 
@@ -30,6 +30,7 @@ def gen_list_rectangle(lottie, layer):
     window = {}
     window["first"] = sys.maxsize
     window["last"] = -1
+    window["waypoints"] = set()
 
     point1 = layer.get_param("point1")
     point2 = layer.get_param("point2")
@@ -71,24 +72,15 @@ def gen_list_rectangle(lottie, layer):
     bevCircle.animate_without_path("bool")
 
     # Minimizing the window size
-    if window["first"] == sys.maxsize and window["last"] == -1:
-        window["first"] = window["last"] = 0
+    clip_frame_window(window)
     ################# END OF SECTION 1 ###################
 
     ################ SECTION 2 ###########################
     # Generating values for all the frames in the window
-
-    fr = window["first"]
-    while fr <= window["last"]:
-        st_val, en_val = insert_dict_at(lottie, -1, fr, False)
-
+    def sample(st_val, fr):
         synfig_rectangle(st_val, point1, point2, expand, bevel, bevCircle, fr)
-        synfig_rectangle(en_val, point1, point2, expand, bevel, bevCircle, fr + 1)
 
-        fr += 1
-    # Setting the final time
-    lottie.append({})
-    lottie[-1]["t"] = fr
+    gen_shape_keyframes(lottie, window, False, sample)
 
 
 def synfig_rectangle(st_val, point1_p, point2_p, expand_p, bevel_p, bevCircle, fr):
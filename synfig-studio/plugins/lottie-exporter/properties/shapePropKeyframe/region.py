@@ -7,7 +7,8 @@ in Lottie format
 import sys
 import settings
 from common.Bline import Bline
-from properties.shapePropKeyframe.helper import insert_dict_at, animate_tangents, convert_tangent_to_lottie
+from common.misc import clip_frame_window
+from properties.shapePropKeyframe.helper import insert_dict_at, animate_tangents, convert_tangent_to_lottie, sample_frames
 from properties.shapePropKeyframe.outline import equalize_length
 from synfig.animation import to_Lottie_axis
 sys.path.append("../../")
@@ -72,21 +73,26 @@ def gen_bline_region(lottie, bline_point):
     origin.animate("vector")
 
     # Minimizing the window size
-    if window["first"] == sys.maxsize and window["last"] == -1:
-        window["first"] = window["last"] = 0
+    clip_frame_window(window)
     ################# END OF SECTION 1 ###################
 
     ################ SECTION 2 ###########################
     # Generating values for all the frames in the window
+    def sample(fr):
+        st_val, en_val = insert_dict_at([], -1, fr, loop)
+        synfig_region(bline, st_val, origin, fr)
+        synfig_region(bline, en_val, origin, fr + 1)
+        return st_val, en_val
+
     fr = window["first"]
     lottie_st_list = []
     lottie_en_list = []
-    while fr <= window["last"]:
+    for st_sample, en_sample in sample_frames(sample, window["first"], window["last"]):
         st_val, en_val = insert_dict_at(lottie, -1, fr, loop)
+        st_val.update(st_sample)
+        en_val.update(en_sample)
         lottie_st_list.append(st_val)
         lottie_en_list.append(en_val)
-        synfig_region(bline, st_val, origin, fr)
-        synfig_region(bline, en_val, origin, fr + 1)
         fr += 1
     equalize_length(lottie_st_list, lottie_en_list)
     # Setting final time
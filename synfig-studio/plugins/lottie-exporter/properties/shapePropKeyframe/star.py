@@ -7,8 +7,9 @@ in Lottie format
 import sys
 import math
 from common.Vector import Vector
+from common.misc import clip_frame_window
 from synfig.animation import to_Synfig_axis
-from properties.shapePropKeyframe.helper import add, insert_dict_at
+from properties.shapePropKeyframe.helper import add, gen_shape_keyframes
 sys.path.append("../../")
 
 
@@ -29,6 +30,7 @@ def gen_list_star(lottie, layer):
     window = {}
     window["first"] = sys.maxsize
     window["last"] = -1
+    window["waypoints"] = set()
 
     origin = layer.get_param("origin")
     radius1 = layer.get_param("radius1")
@@ -66,23 +68,15 @@ def gen_list_star(lottie, layer):
     regular_polygon.animate_without_path("bool")
 
     # Minimizing the window size
-    if window["first"] == sys.maxsize and window["last"] == -1:
-        window["first"] = window["last"] = 0
+    clip_frame_window(window)
     ################# END OF SECTION 1 ###################
 
     ################ SECTION 2 ###########################
     # Generating values for all the frames in the window
-
-    fr = window["first"]
-    while fr <= window["last"]:
-        st_val, en_val = insert_dict_at(lottie, -1, fr, False)
+    def sample(st_val, fr):
         synfig_star(st_val, mx_points, origin, radius1, radius2, angle, points, regular_polygon, fr)
-        synfig_star(en_val, mx_points, origin, radius1, radius2, angle, points, regular_polygon, fr + 1)
 
-        fr += 1
-    # Setting the final time
-    lottie.append({})
-    lottie[-1]["t"] = fr
+    gen_shape_keyframes(lottie, window, False, sample)
 
 
 def get_max_points(points):
@@ -39,6 +39,22 @@ DEFAULT_SKEW = 0
 GAMMA = [2.2, 2.2, 2.2]     # Default RGB gamma correction values
 PIX_PER_UNIT = 0
 TANGENT_FACTOR = 3.0
+SAMPLES = 50    # Maximum number of samples taken on a curve while converting outlines
+FLATNESS_TOLERANCE = 0.25   # Max deviation(in pixels) of sampled outlines from the curve, 0 means always take SAMPLES
+SHAPE_EASING_TOLERANCE = 0.25   # Max deviation(in pixels) of eased circle, rectangle, star and polygon keyframes from the sampled frames
+QUALITY_PRESETS = {     # Sampling settings of the quality presets, "normal" being the defaults above
+    "draft": {"samples": 20, "flatness": 1.0, "shape_easing": 1.0},
+    "normal": {"samples": SAMPLES, "flatness": FLATNESS_TOLERANCE, "shape_easing": SHAPE_EASING_TOLERANCE},
+    "high": {"samples": 100, "flatness": 0.05, "shape_easing": 0.05},
+}
+BEGIN_TIME = None   # Overrides the begin-time of the canvas, in Synfig time format like "2s" or "48f"
+END_TIME = None     # Overrides the end-time of the canvas
+FPS = None          # Overrides the frame rate of the canvas
+DOWNSCALE_IMAGES = False    # Resample imported images to the largest size they are displayed at, needs Pillow
+INLINE_IMAGE_SIZE = 0   # Max size(in bytes) of the images embedded in the json as data URIs, 0 means never
+JOBS = 1    # Number of worker processes sampling the frames of outlines and regions
+GROUP_BLUR = False  # Blur the layers below a blur layer as one precomp, instead of blurring each of them
+CULL_LAYERS = False     # Leave out the layers which are transparent or outside the view box over all the exported frames
 IN_TANGENT_X = 0.58
 IN_TANGENT_Y = 1
 OUT_TANGENT_X = 0.42
@@ -58,12 +74,20 @@ MASK_ADDITIVE = "a"
 INSIDE_PRECOMP = False  # specifies if we are inside a precomp or not
 ADDITIONAL_PRECOMP_WIDTH = 0
 ADDITIONAL_PRECOMP_HEIGHT = 0
+MAX_PRECOMP_INFLATION = 4   # Max increase in the size of precompositions, in multiples of the canvas size
+NON_OVERSHOOTING = {"linear", "constant", "clamped", "halt"}   # Interpolations staying between the values of their waypoints
+EXTENT_PARAMS = {"radius", "radius1", "radius2", "expand", "feather", "feather_x", "feather_y", "bline", "vector_list", "wplist"}  # Parameters holding reals by which a shape reaches beyond its vectors
 NOT_SUPPORTED_TEXT = "Layer '%s' is not supported yet. For more information, contact us on Synfig forums or Github page"
 NOT_ACTIVE_TEXT = "Layer '%s' is not active"
 EXCLUDE_FROM_RENDERING = "Layer '%s' is excluded from rendering"
+NO_PILLOW_TEXT = "Pillow is not installed, images are copied without downscaling"
+SKIPPED_FRAMES_TEXT = "%d frames outside of the canvas time were not sampled"
+CULLED_LAYER_TEXT = "Layer '%s' is left out, as %s"
+CULLED_LAYERS_TEXT = "%d layers which can not be seen were left out"
 SHAPE_LAYER = {"simple_circle", "linear_gradient", "radial_gradient"}
 BLUR_LAYER = {"blur"}
 SOLID_LAYER = {"solid_color"}
+SHAPE_STYLE_PARAMS = {"z_depth", "amount", "blend_method", "color", "invert", "antialias", "feather", "blurtype", "winding_style"}   # Params of shape layers which do not change their path
 SHAPE_SOLID_LAYER = {"region", "polygon", "advanced_outline", "outline", "circle", "rectangle", "filled_rectangle", "star"} 
 IMAGE_LAYER = {"import"}
 PRE_COMP_LAYER = {"rotate", "zoom", "translate", "stretch"}
@@ -107,12 +131,24 @@ def init():
     view_box_canvas = {}
     global num_images
     num_images = Count()
+    global image_files  # hash and size of the imported image files
+    image_files = {}
+    global image_assets # image assets, by the hash of the image
+    image_assets = {}
+    global image_names  # hash of the image copied with each name
+    image_names = {}
+    global image_copies # images to be copied or embedded after the layers are generated, by the asset id
+    image_copies = {}
     global file_name
     file_name = {}
     global num_precomp
     num_precomp = Count()
-    global OUTLINE_GROW    # outline grow param of group layer
-    OUTLINE_GROW = [0]
+    global asset_index  # lottie assets, by their id
+    asset_index = {}
+    global precomp_assets   # id of the precomp assets, by the json of their layers
+    precomp_assets = {}
+    global OUTLINE_GROW    # outline grow param of group layers, and their combined value at each frame
+    OUTLINE_GROW = [{"param": None, "constant": True, "values": {}}]
     global layer_count  # will only count the layers which do not have there desc set
     layer_count = Count()
     global canvas_count # will only count the canvas which do not have any names
@@ -121,5 +157,17 @@ def init():
     controller_count = Count()
     global blur_dictionary #used to make a dictionary of blur layers
     blur_dictionary = {}
-    global non_blur_dictionary #used to make a dictionary of all non blur layers
-    non_blur_dictionary = {}
+    global active_blurs # levels of the blur layers above the layer being generated
+    active_blurs = []
+    global blur_targets # lottie layers to be blurred once all the layers are generated
+    blur_targets = []
+    global bline_lists  # bline lists at each frame of the last sampled bline, by its "key"
+    bline_lists = {"key": None, "frames": {}}
+    global skipped_frames   # frames of the animations outside the exported frames, which were not sampled
+    skipped_frames = 0
+    global culled_layers    # layers left out as they can not be seen
+    culled_layers = 0
+    global gamma_exponents  # 1/gamma of the red, green and blue channels, for gamma_correct()
+    gamma_exponents = [1/gamma for gamma in GAMMA]
+    global shape_paths  # shape keyframes, shared by the shapes having the same path
+    shape_paths = {}
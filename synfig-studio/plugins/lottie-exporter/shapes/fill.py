@@ -6,7 +6,7 @@ import sys
 import settings
 from properties.value import gen_properties_value
 from properties.valueKeyframed import gen_value_Keyframed
-from common.misc import is_animated
+from common.misc import is_animated, gamma_correct
 from common.Count import Count
 sys.path.append("..")
 
@@ -42,7 +42,7 @@ def gen_shapes_fill(lottie, layer):
         red = float(val[0].text)
         green = float(val[1].text)
         blue = float(val[2].text)
-        red, green, blue = red ** (1/settings.GAMMA[0]), green ** (1/settings.GAMMA[1]), blue ** (1/ settings.GAMMA[2])
+        red, green, blue = gamma_correct(red, 0), gamma_correct(green, 1), gamma_correct(blue, 2)
         alpha = float(val[3].text)
         gen_properties_value(lottie["c"],
                              [red, green, blue, alpha],
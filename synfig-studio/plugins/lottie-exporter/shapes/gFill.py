@@ -3,6 +3,7 @@ Will have all the functions required for generate the fill(color) in lottie
 """
 
 import sys
+import heapq
 from lxml import etree
 import settings
 from properties.value import gen_properties_value
@@ -171,38 +172,32 @@ def modify_gradient(gradient):
     Returns:
         (None)
     """
-    positions = []
     gradient.animate("gradient")    # This is called initially so as to ensure that each color is inside a waypoint 
-    for waypoint in gradient.get()[0]:
-        gd = waypoint[0]
-        for color in gd:
-            positions.append(float(color.attrib["pos"]))
-    positions.sort()
-
-    # Synfig uses real_high_precision to differentiate 2 items
-    discard = set()
-    for i in range(len(positions)):
-        for j in range(i+1, len(positions)):
-            if abs(positions[i] - positions[j]) < real_high_precision():
-                discard.add(j)
-    discard_values = [positions[i] for i in discard]
-
-    for val in discard_values:
-        positions.remove(val)
+    waypoints = gradient.get()[0]
+    gradients = [Gradient(waypoint[0]) for waypoint in waypoints]
+
+    # The sorted positions of each waypoint are merged, Synfig uses
+    # real_high_precision to differentiate 2 items
+    positions = []
+    prev = None
+    for pos in heapq.merge(*[sorted(col[0] for col in gd.get_colors()) for gd in gradients]):
+        if prev is None or pos - prev >= real_high_precision():
+            positions.append(pos)
+        prev = pos
 
     # Now the color is added to all the positions in all the waypoints
-    for waypoint in gradient.get()[0]:
-        gd = Gradient(waypoint[0])
+    for waypoint, gd in zip(waypoints, gradients):
         add_colors_to_gradient(waypoint, gd, positions)
 
-    
+
 def add_colors_to_gradient(waypoint, gd, positions):
     """
     Deletes previous values of color and introduce new depending upon the positions given
 
     Args:
-        waypoint () : 
-        gd () :
+        waypoint  (lxml.etree._Element)      : Waypoint of the gradient
+        gd        (common.Gradient.Gradient) : Gradient of the waypoint
+        positions (list)                     : Sorted positions of the new colors
 
     Returns:
         (None)
@@ -215,7 +210,6 @@ def add_colors_to_gradient(waypoint, gd, positions):
     st = "<color pos='{pos}'><r>{red}</r><g>{green}</g><b>{blue}</b><a>{alpha}</a></color>"
 
     # Now add all the colors back
-    for val in positions:
-        color = gd.get_color_at_x(val)
+    for val, color in zip(positions, gd.get_colors_at(positions)):
         lxml_col = etree.fromstring(st.format(pos=val, red=color.red, green=color.green, blue=color.blue, alpha=color.alpha))
         waypoint[0].append(lxml_col)
@@ -2,74 +2,137 @@
 Will store all the functions corresponding to Image Assets in lottie
 """
 
+import io
 import os
 import sys
+import math
+import base64
 import struct
 import imghdr
 import shutil
+import hashlib
+import logging
 import settings
 sys.path.append("..")
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
 
+BASE64_CHUNK = 3 * 4096    # Multiple of 3, so that the encoded chunks can be joined
 
-def get_image_size(fname):
+
+def get_image_size(data):
     '''
     https://stackoverflow.com/questions/8032642/how-to-obtain-image-size-using-standard-python-class-without-using-external-lib
     Determine the image type of fhandle and return its size.
     from draco
 
     Args:
-        fname (str) : File name
+        data (bytes) : Contents of the image file
 
     Returns:
         (int, int) : width and height of image file is returned
         (None)     : If some exception occurs while calculating
     '''
-    with open(fname, 'rb') as fhandle:
-        head = fhandle.read(24)
-        if len(head) != 24:
+    fhandle = io.BytesIO(data)
+    head = fhandle.read(24)
+    if len(head) != 24:
+        return
+    what = imghdr.what(None, data[:32])
+    if what == 'png':
+        check = struct.unpack('>i', head[4:8])[0]
+        if check != 0x0d0a1a0a:
             return
-        if imghdr.what(fname) == 'png':
-            check = struct.unpack('>i', head[4:8])[0]
-            if check != 0x0d0a1a0a:
-                return
-            width, height = struct.unpack('>ii', head[16:24])
-        elif imghdr.what(fname) == 'gif':
-            width, height = struct.unpack('<HH', head[6:10])
-        elif imghdr.what(fname) == 'jpeg':
-            try:
-                fhandle.seek(0) # Read 0xff next
-                size = 2
-                ftype = 0
-                while not 0xc0 <= ftype <= 0xcf:
-                    fhandle.seek(size, 1)
+        width, height = struct.unpack('>ii', head[16:24])
+    elif what == 'gif':
+        width, height = struct.unpack('<HH', head[6:10])
+    elif what == 'jpeg':
+        try:
+            fhandle.seek(0) # Read 0xff next
+            size = 2
+            ftype = 0
+            while not 0xc0 <= ftype <= 0xcf:
+                fhandle.seek(size, 1)
+                byte = fhandle.read(1)
+                while ord(byte) == 0xff:
                     byte = fhandle.read(1)
-                    while ord(byte) == 0xff:
-                        byte = fhandle.read(1)
-                    ftype = ord(byte)
-                    size = struct.unpack('>H', fhandle.read(2))[0] - 2
-                # We are at a SOFn block
-                fhandle.seek(1, 1)  # Skip `precision' byte.
-                height, width = struct.unpack('>HH', fhandle.read(4))
-            except Exception: #IGNORE:W0703
-                return
-        else:
+                ftype = ord(byte)
+                size = struct.unpack('>H', fhandle.read(2))[0] - 2
+            # We are at a SOFn block
+            fhandle.seek(1, 1)  # Skip `precision' byte.
+            height, width = struct.unpack('>HH', fhandle.read(4))
+        except Exception: #IGNORE:W0703
+            return
+    else:
+        return
+    return width, height
+
+
+def get_image_file(file_path):
+    """
+    Reads an image file once per export, and finds its hash and size
+
+    Args:
+        file_path (str) : Absolute path of the image file
+
+    Returns:
+        (dict) : "hash", "size"(width and height) and "bytes"(file size) of the image
+    """
+    if file_path not in settings.image_files:
+        with open(file_path, "rb") as fhandle:
+            data = fhandle.read()
+        settings.image_files[file_path] = {"hash": hashlib.sha1(data).hexdigest(),
+                                           "size": get_image_size(data),
+                                           "bytes": len(data)}
+    return settings.image_files[file_path]
+
+
+def copy_image(src, dst, image):
+    """
+    Copies an image into the images directory, unless the same image is
+    already there: either with the same size and modification time, or with
+    the same contents
+
+    Args:
+        src   (str)  : Path of the original image
+        dst   (str)  : Path of the copy
+        image (dict) : Hash and file size of the original image
+
+    Returns:
+        (None)
+    """
+    if os.path.isfile(dst):
+        if os.path.samefile(src, dst):
             return
-        return width, height
+        src_stat, dst_stat = os.stat(src), os.stat(dst)
+        if src_stat.st_size == dst_stat.st_size:
+            if src_stat.st_mtime == dst_stat.st_mtime:
+                return
+            with open(dst, "rb") as fhandle:
+                if hashlib.sha1(fhandle.read()).hexdigest() == image["hash"]:
+                    return
+
+    # using shutil to make a copy of the image
+    shutil.copy(src, dst)
+    # copy meta-data of the file
+    shutil.copystat(src, dst)
 
 
 def add_image_asset(lottie, layer):
     """
     Generates the dictionary corresponding to sources/image.json
-    Returns: st required in calling function
+    Returns: st required in calling function. Images with the same contents
+    share one asset, even if they are imported from different files
 
     Args:
-        lottie (dict)                : Lottie layer
+        lottie (list)                : Lottie assets, a new asset is appended if needed
         layer  (commong.Layer.Layer) : Synfig layer
 
     Returns:
         (dict) : Stores address of parameters: "tl", "br", "filename"
+        (dict) : The image asset
     """
-    lottie["id"] = "image_" + str(settings.num_images.inc())
     st = {}     # Store the address of children
 
     st["tl"] = layer.get_param("tl")
@@ -78,10 +141,18 @@ def add_image_asset(lottie, layer):
 
     file_path = os.path.join(settings.file_name["fd"], st["filename"][0].text)
     file_path = os.path.abspath(file_path)
-    width, height = get_image_size(file_path)
-    lottie["w"] = width
+    image = get_image_file(file_path)
+    if image["hash"] in settings.image_assets:
+        return st, settings.image_assets[image["hash"]]
+
+    lottie.append({})
+    asset = lottie[-1]
+    asset["id"] = "image_" + str(settings.num_images.inc())
+    settings.asset_index[asset["id"]] = asset
+    width, height = image["size"]
+    asset["w"] = width
 
-    lottie["h"] = height
+    asset["h"] = height
 
     images_dir = os.path.join(settings.file_name["fd"], "images")
     images_dir = os.path.abspath(images_dir)
@@ -91,18 +162,138 @@ def add_image_asset(lottie, layer):
         except OSError:
             print("Creation of the directory %s failed" % images_dir)
 
-    # copy original image to images directory
-    src = file_path
+    # copy original image to images directory, an image with another name
+    # is kept apart by its hash
     head, tail = os.path.split(file_path)
+    if settings.image_names.get(tail, image["hash"]) != image["hash"]:
+        tail = image["hash"][:12] + "_" + tail
+    settings.image_names[tail] = image["hash"]
     new_image_path = os.path.join(images_dir, tail)
 
-    try:
-        # using shutil to make a copy of the image
-        shutil.copy(src, new_image_path)
-        # copy meta-data of the file
-        shutil.copystat(src, new_image_path)
-    except shutil.SameFileError:
-        pass
-    lottie["u"] = "images/"
-    lottie["p"] = tail
-    return st
\ No newline at end of file
+    asset["u"] = "images/"
+    asset["p"] = tail
+    settings.image_assets[image["hash"]] = asset
+    # The image is copied by save_image_assets(), once its displayed size is known
+    settings.image_copies[asset["id"]] = {"src": file_path,
+                                          "dst": new_image_path,
+                                          "image": image,
+                                          "display": [0, 0],
+                                          "in_precomp": False}
+    return st, asset
+
+
+def update_image_display(asset, width, height):
+    """
+    Records the size at which an image asset is displayed, its largest
+    size decides the size of the downscaled image. Images displayed inside
+    precomps are never downscaled, as the size does not include the scale of
+    the precomps
+
+    Args:
+        asset  (dict)  : The image asset
+        width  (float) : Displayed width in pixels
+        height (float) : Displayed height in pixels
+
+    Returns:
+        (None)
+    """
+    pending = settings.image_copies[asset["id"]]
+    # The groups and transform layers above a precomp scale it too
+    if settings.INSIDE_PRECOMP:
+        pending["in_precomp"] = True
+    display = pending["display"]
+    display[0] = max(display[0], abs(width))
+    display[1] = max(display[1], abs(height))
+
+
+def downscale_image(src, size, display):
+    """
+    Resamples an image to the largest size it is displayed at, images which
+    are never displayed smaller than their original size are left as they are
+
+    Args:
+        src     (str)  : Path of the original image
+        size    (list) : Width and height of the original image
+        display (list) : Largest displayed width and height, in pixels
+
+    Returns:
+        (bytes) : Contents of the downscaled image
+        (tuple) : Width and height of the downscaled image
+        (None)  : If the image need not be downscaled
+    """
+    new_size = tuple(min(orig, max(1, int(math.ceil(disp)))) for orig, disp in zip(size, display))
+    if new_size == tuple(size):
+        return None, None
+    with Image.open(src) as img:
+        fmt = img.format
+        img = img.resize(new_size, Image.LANCZOS)
+    fhandle = io.BytesIO()
+    img.save(fhandle, format=fmt)
+    return fhandle.getvalue(), new_size
+
+
+def gen_data_uri(fhandle, what):
+    """
+    Encodes an image as a data URI, reading and encoding it in chunks
+
+    Args:
+        fhandle (file-like) : Opened image, in binary mode
+        what    (str)       : Type of the image given by imghdr
+
+    Returns:
+        (str) : The data URI
+    """
+    out = ["data:image/", what, ";base64,"]
+    chunk = fhandle.read(BASE64_CHUNK)
+    while chunk:
+        out.append(base64.b64encode(chunk).decode("ascii"))
+        chunk = fhandle.read(BASE64_CHUNK)
+    return "".join(out)
+
+
+def save_image_assets():
+    """
+    Copies the images of all the image assets into the images directory, after
+    downscaling them if settings.DOWNSCALE_IMAGES is set. A downscaled image is
+    written under a name starting with the hash and its size. Images no larger
+    than settings.INLINE_IMAGE_SIZE are embedded in their assets instead
+
+    Args:
+        (None)
+
+    Returns:
+        (None)
+    """
+    downscale = settings.DOWNSCALE_IMAGES
+    if downscale and Image is None:
+        logging.warning(settings.NO_PILLOW_TEXT)
+        downscale = False
+
+    for asset in settings.image_assets.values():
+        pending = settings.image_copies[asset["id"]]
+        data = None
+        if downscale and not pending["in_precomp"]:
+            data, new_size = downscale_image(pending["src"], pending["image"]["size"], pending["display"])
+        file_size = pending["image"]["bytes"] if data is None else len(data)
+
+        if file_size <= settings.INLINE_IMAGE_SIZE:
+            if data is None:
+                with open(pending["src"], "rb") as fhandle:
+                    what = imghdr.what(None, fhandle.read(32))
+                    fhandle.seek(0)
+                    asset["p"] = gen_data_uri(fhandle, what)
+            else:
+                asset["p"] = gen_data_uri(io.BytesIO(data), imghdr.what(None, data[:32]))
+            asset["u"] = ""
+            asset["e"] = 1
+        elif data is None:
+            copy_image(pending["src"], pending["dst"], pending["image"])
+        else:
+            # The downscaled image gets its own name, so that the original
+            # image is never overwritten, even if it is in the images directory
+            tail = "%s_%dx%d_%s" % (pending["image"]["hash"][:12], new_size[0], new_size[1], os.path.basename(pending["src"]))
+            dst = os.path.join(os.path.dirname(pending["dst"]), tail)
+            if not (os.path.exists(dst) and os.path.samefile(pending["src"], dst)):
+                with open(dst, "wb") as fhandle:
+                    fhandle.write(data)
+            asset["p"] = tail
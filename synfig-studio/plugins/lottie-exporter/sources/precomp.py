@@ -3,6 +3,7 @@ Will store all the functions corresponding to Image Assets in lottie
 """
 
 import sys
+import json
 import settings
 import layers.driver
 sys.path.append("..")
@@ -22,8 +23,38 @@ def add_precomp_asset(lottie, canvas, layer_itr):
         (str) : Unique ID of the asset
     """
     lottie["id"] = "precomp_" + str(settings.num_precomp.inc())
+    settings.asset_index[lottie["id"]] = lottie
     lottie["layers"] = []   # If no layer is added, then might result in an error, keep in mind
 
     # Parsing the canvas to class canvas
     layers.driver.gen_layers(lottie["layers"], canvas, layer_itr-1)
     return lottie["id"]
+
+
+def share_precomp_asset(lottie):
+    """
+    If a precomp asset with the same layers was generated before, the precomp
+    layer is made to refer to that asset and its own asset is removed. Assets
+    of nested layers are shared before their parents, so instances of the same
+    canvas end up sharing the whole tree of assets
+
+    Args:
+        lottie (dict) : Lottie format precomp layer, its asset is complete
+
+    Returns:
+        (None)
+    """
+    asset = settings.asset_index[lottie["refId"]]
+    key = json.dumps(asset["layers"], sort_keys=True)
+    if key not in settings.precomp_assets:
+        settings.precomp_assets[key] = asset["id"]
+        return
+
+    lottie["refId"] = settings.precomp_assets[key]
+    del settings.asset_index[asset["id"]]
+    # Nested assets are shared already, so this asset is found at the end
+    assets = settings.lottie_format["assets"]
+    itr = len(assets) - 1
+    while assets[itr] is not asset:
+        itr -= 1
+    del assets[itr]
@@ -0,0 +1,244 @@
+# pylint: disable=line-too-long
+"""
+Will store all the functions needed to find the layers which can not be seen
+in the exported frames, so that they are left out of the Lottie file
+"""
+
+import sys
+import settings
+from common.misc import get_frame
+from layers.group import get_static_value, is_chosen_by_parent
+sys.path.append("..")
+
+
+def get_bounding_waypoints(animated, windowed):
+    """
+    Returns the waypoints whose values bound an animation over the exported
+    frames: the waypoints inside them and the ones just outside. Interpolations
+    which can overshoot their waypoints are only bounded when every waypoint
+    has the same value
+
+    Args:
+        animated (lxml.etree._Element) : Synfig format animation
+        windowed (bool)                : False if the time of the animation is not
+                                         the time of the root canvas
+
+    Returns:
+        (list) : The waypoints
+        (None) : If the waypoints do not bound the animation
+    """
+    waypoints = sorted((child for child in animated if child.tag == "waypoint"), key=get_frame)
+    values = {get_static_value(waypoint[0]) for waypoint in waypoints}
+    if len(values) == 1 and None not in values:
+        return waypoints[:1]
+
+    if windowed:
+        first, last = 0, len(waypoints) - 1
+        while first < last and get_frame(waypoints[first + 1]) <= settings.lottie_format["ip"]:
+            first += 1
+        while last > first and get_frame(waypoints[last - 1]) >= settings.lottie_format["op"]:
+            last -= 1
+        waypoints = waypoints[first:last + 1]
+
+    for waypoint in waypoints:
+        if waypoint.attrib.get("before") not in settings.NON_OVERSHOOTING or \
+           waypoint.attrib.get("after") not in settings.NON_OVERSHOOTING:
+            return None
+    return waypoints
+
+
+def get_node_bounds(node, layer, windowed, bounds, tangent=False, value_type=None):
+    """
+    Adds the values stored in a parameter, over the exported frames, to the
+    bounds: the box of its vectors, the largest absolute real and the longest
+    tangent
+
+    Args:
+        node       (lxml.etree._Element) : Parameter or value in Synfig format
+        layer      (common.Layer.Layer)  : Synfig layer of the parameter
+        windowed   (bool)                : False if the time of the layer is not
+                                           the time of the root canvas
+        bounds     (dict)                : "box" as [min x, min y, max x, max y]
+                                           or None, "real" and "tangent"
+        tangent    (bool)                : True if the value is a part of a tangent
+        value_type (str)                 : Tag of the values, if other values can
+                                           not be bounded
+
+    Returns:
+        (bool) : False if the values can not be bounded
+    """
+    if "use" in node.keys() and len(node) == 0:
+        key = node.attrib["use"]
+        if "#" in key or ":" in key.lstrip(":"):
+            return False
+        key = key.lstrip(":")
+        value = layer.getparent().get_def(key)
+        if value is None:
+            value = settings.ROOT_CANVAS.get_def(key)
+        if value is None:
+            return False
+        return get_node_bounds(value, layer, windowed, bounds, tangent, value_type)
+
+    if node.tag == "animated":
+        waypoints = get_bounding_waypoints(node, windowed)
+        if waypoints is None:
+            return False
+        return all(get_node_bounds(waypoint[0], layer, windowed, bounds, tangent, value_type) for waypoint in waypoints)
+
+    if value_type is not None and node.tag not in {"param", value_type}:
+        return False
+
+    # Members of composites can have the names of convert methods
+    if node.tag in settings.CONVERT_METHODS and node.tag not in {"composite", "radial_composite"} and \
+       node.getparent().tag != "composite":
+        return False
+
+    if node.tag == "vector" and node.find("x") is not None:
+        x, y = float(node.find("x").text), float(node.find("y").text)
+        if tangent:
+            bounds["tangent"] = max(bounds["tangent"], (x*x + y*y) ** 0.5)
+        elif bounds["box"] is None:
+            bounds["box"] = [x, y, x, y]
+        else:
+            box = bounds["box"]
+            bounds["box"] = [min(box[0], x), min(box[1], y), max(box[2], x), max(box[3], y)]
+        return True
+    if node.tag == "real" and "value" in node.keys():
+        # The radius of a radial composite tangent is its length
+        key = "tangent" if tangent else "real"
+        bounds[key] = max(bounds[key], abs(float(node.attrib["value"])))
+        return True
+
+    for child in node:
+        if not get_node_bounds(child, layer, windowed, bounds, tangent or child.tag in {"t1", "t2"}, value_type):
+            return False
+    return True
+
+
+def is_transparent(layer, windowed):
+    """
+    Tells whether the amount of a layer stays 0 over the exported frames. Only
+    the layers whose amount is their opacity are checked: the amount of blur
+    and transform layers is their size, angle or scale
+
+    Args:
+        layer    (common.Layer.Layer) : Synfig format layer
+        windowed (bool)               : False if the time of the layer is not the
+                                        time of the root canvas
+
+    Returns:
+        (bool) : True if the layer is never seen
+    """
+    if layer.get_type() not in set.union(settings.SHAPE_LAYER, settings.SOLID_LAYER, settings.SHAPE_SOLID_LAYER,
+                                         settings.IMAGE_LAYER, settings.GROUP_LAYER):
+        return False
+    amount = layer.get_param("amount").get()
+    if amount is None:
+        return False
+    bounds = {"box": None, "real": 0, "tangent": 0}
+    return get_node_bounds(amount, layer, windowed, bounds, value_type="real") and bounds["real"] == 0
+
+
+def get_layer_box(layer, windowed):
+    """
+    Bounds the area covered by a shape or image layer over the exported frames:
+    the box of its origin, plus the box of its other vectors, grown by a third
+    of its longest tangent, its radii, widths and feather
+
+    Args:
+        layer    (common.Layer.Layer) : Synfig format layer
+        windowed (bool)               : False if the time of the layer is not the
+                                        time of the root canvas
+
+    Returns:
+        (list) : [min x, min y, max x, max y] in units
+        (None) : If the layer can not be bounded
+    """
+    origin, box = [0, 0, 0, 0], None
+    real, tangent, width = 0, 0, 0
+    for param in layer.get_layer():
+        if param.tag != "param":
+            continue
+        name = param.attrib["name"]
+        bounds = {"box": None, "real": 0, "tangent": 0}
+        if not get_node_bounds(param, layer, windowed, bounds):
+            return None
+        if bounds["box"] is not None:
+            if name == "origin":
+                origin = bounds["box"]
+            elif box is None:
+                box = bounds["box"]
+            else:
+                box = [min(box[0], bounds["box"][0]), min(box[1], bounds["box"][1]),
+                       max(box[2], bounds["box"][2]), max(box[3], bounds["box"][3])]
+        tangent = max(tangent, bounds["tangent"])
+        if name in settings.EXTENT_PARAMS:
+            real = max(real, bounds["real"])
+        elif name == "width":
+            width = bounds["real"]
+
+    if box is None:
+        box = [0, 0, 0, 0]
+    grow = tangent / 3 + real + width * max(real, 1)
+    return [origin[0] + box[0] - grow, origin[1] + box[1] - grow,
+            origin[2] + box[2] + grow, origin[3] + box[3] + grow]
+
+
+def is_outside_view(layer):
+    """
+    Tells whether a shape or image layer of the root canvas stays outside the
+    view box over the exported frames. Layers which fill the outside of their
+    shape, do not simply cover the layers below, or are blurred or grown by
+    the layers above them are never outside the view box
+
+    Args:
+        layer (common.Layer.Layer) : Synfig format layer
+
+    Returns:
+        (bool) : True if the layer is never seen
+    """
+    if settings.INSIDE_PRECOMP or settings.active_blurs:
+        return False
+    if layer.get_type() not in set.union(settings.SHAPE_SOLID_LAYER, settings.IMAGE_LAYER, {"simple_circle"}):
+        return False
+    for grow in settings.OUTLINE_GROW:
+        bounds = {"box": None, "real": 0, "tangent": 0}
+        if grow["param"] is not None and not (get_node_bounds(grow["param"].get(), layer, True, bounds) and bounds["real"] == 0):
+            return False
+    blend = layer.get_param("blend_method").get()
+    if blend is not None and get_static_value(blend[0]) != 0:
+        return False
+    invert = layer.get_param("invert").get()
+    if invert is not None and get_static_value(invert[0]) is not False:
+        return False
+
+    box = get_layer_box(layer, True)
+    if box is None:
+        return False
+    view = settings.view_box_canvas["val"]
+    left, right = min(view[0], view[2]), max(view[0], view[2])
+    bottom, top = min(view[1], view[3]), max(view[1], view[3])
+    return box[2] < left or box[0] > right or box[3] < bottom or box[1] > top
+
+
+def get_cull_reason(layer):
+    """
+    Finds why a layer can be left out of the Lottie file. Layers of switch
+    groups and z-range groups are always kept, as their opacities are set by
+    their position in the group
+
+    Args:
+        layer (common.Layer.Layer) : Synfig format layer
+
+    Returns:
+        (str)  : Why the layer is never seen
+        (None) : If the layer might be seen
+    """
+    if is_chosen_by_parent(layer):
+        return None
+    windowed = not settings.INSIDE_PRECOMP
+    if is_transparent(layer, windowed):
+        return "its amount is 0"
+    if is_outside_view(layer):
+        return "it is outside the view box"
+    return None
@@ -5,6 +5,7 @@ Synfig/precomp layer of Lottie
 """
 
 import sys
+import math
 import settings
 from common.misc import is_animated
 from common.Vector import Vector
@@ -12,6 +13,213 @@ import common
 sys.path.append("..")
 
 
+def get_node_extent(node, defs):
+    """
+    Finds how far the values stored in a parameter reach, without evaluating
+    them
+
+    Args:
+        node (lxml.etree._Element) : Parameter in Synfig format
+        defs (dict)                : Exported values of the file, by their ids
+
+    Returns:
+        (float, float, float) : Largest length of the vectors, largest absolute
+                                real and largest length of the tangents, doubled
+                                if some waypoint's interpolation can overshoot
+        (None)                : If the values are converted, or linked to
+                                another file
+    """
+    vec, real, tangent, factor = 0, 0, 0, 1
+    for child in node.iter():
+        if "use" in child.keys():
+            key = child.attrib["use"].lstrip(":")
+            if key not in defs:
+                return None
+            extent = get_node_extent(defs[key], defs)
+            if extent is None:
+                return None
+            vec, real, tangent = max(vec, extent[0]), max(real, extent[1]), max(tangent, extent[2])
+        # Members of composites can have the names of convert methods
+        if child.tag in settings.CONVERT_METHODS and child.tag not in {"composite", "radial_composite"} and \
+           child.getparent().tag != "composite":
+            return None
+
+        if child.tag == "waypoint":
+            if child.attrib.get("before") not in settings.NON_OVERSHOOTING or \
+               child.attrib.get("after") not in settings.NON_OVERSHOOTING:
+                factor = 2
+            continue
+        if child.tag == "vector" and child.find("x") is not None:
+            value = math.hypot(float(child.find("x").text), float(child.find("y").text))
+        elif child.tag == "real" and "value" in child.keys():
+            value = abs(float(child.attrib["value"]))
+        else:
+            continue
+
+        # The radius of a radial composite tangent is its length
+        if any(parent.tag in {"t1", "t2"} for parent in child.iterancestors()):
+            tangent = max(tangent, value)
+        elif child.tag == "vector":
+            vec = max(vec, value)
+        else:
+            real = max(real, value)
+    return vec * factor, real * factor, tangent * factor
+
+
+def get_layer_params(layer):
+    """
+    Returns the parameters of a Synfig layer element by their names
+
+    Args:
+        layer (lxml.etree._Element) : Synfig format layer
+
+    Returns:
+        (dict) : Parameters by their names
+    """
+    return {child.attrib["name"]: child for child in layer if child.tag == "param"}
+
+
+def get_shape_extent(params, defs):
+    """
+    Bounds the distance from the origin reached by a shape: its origin, plus
+    its farthest point, plus a third of its longest tangent, plus its radii,
+    widths and feather
+
+    Args:
+        params (dict) : Parameters of the Synfig layer
+        defs   (dict) : Exported values of the file, by their ids
+
+    Returns:
+        (float) : Distance in units
+        (None)  : If the shape can not be bounded
+    """
+    origin, vec, real, tangent, width = 0, 0, 0, 0, 0
+    for name, param in params.items():
+        extent = get_node_extent(param, defs)
+        if extent is None:
+            return None
+        if name == "origin":
+            origin = extent[0]
+        else:
+            vec = max(vec, extent[0])
+        tangent = max(tangent, extent[2])
+        if name in settings.EXTENT_PARAMS:
+            real = max(real, extent[1])
+        elif name == "width":
+            width = extent[1]
+    return origin + vec + tangent / 3 + real + width * max(real, 1)
+
+
+def get_canvas_extent(canvas, defs, nested=False):
+    """
+    Bounds the distance from the origin reached by the layers of a canvas, as
+    seen from above the canvas, and as needed inside any pre-composition made
+    from the canvas, its groups or its transformation layers
+
+    Args:
+        canvas (lxml.etree._Element) : Synfig format canvas
+        defs   (dict)                : Exported values of the file, by their ids
+        nested (bool)                : True if the canvas is inside a group
+
+    Returns:
+        (float, float) : Distance reached by the canvas, and the largest distance
+                         needed inside its pre-compositions, in units
+        (None)         : If some layer can not be bounded
+    """
+    reach, needed, fills = 0, 0, False
+    # Layers at the start of the canvas lie below the later ones
+    for layer in canvas:
+        if layer.tag != "layer" or layer.attrib.get("active") == "false" or \
+           layer.attrib.get("exclude_from_rendering") == "true":
+            continue
+        typ = layer.attrib.get("type")
+        params = get_layer_params(layer)
+
+        if typ in settings.GROUP_LAYER:
+            if "canvas" not in params or len(params["canvas"]) == 0 or params["canvas"][0].tag != "canvas" or \
+               "transformation" not in params or params["transformation"][0].tag != "composite":
+                return None
+            inner = get_canvas_extent(params["canvas"][0], defs, True)
+            transform = {child.tag: child for child in params["transformation"][0]}
+            if set(transform) != {"offset", "angle", "skew_angle", "scale"} or transform["skew_angle"][0].tag != "angle" or \
+               float(transform["skew_angle"][0].attrib["value"]) != 0:
+                return None
+            transform = {key: get_node_extent(child, defs) for key, child in transform.items()}
+            origin = get_node_extent(params["origin"], defs)
+            if inner is None or origin is None or None in transform.values():
+                return None
+            reach = max(reach, transform["offset"][0] + transform["scale"][0] * (inner[0] + origin[0]))
+            needed = max(needed, inner[1])
+
+        elif typ in settings.PRE_COMP_LAYER:
+            # These transform every layer below them
+            if fills:
+                return None
+            extents = [get_node_extent(param, defs) for param in params.values()]
+            if None in extents:
+                return None
+            vec = max(extent[0] for extent in extents)
+            real = max(extent[1] for extent in extents)
+            if typ == "rotate":
+                reach += 2 * vec
+            elif typ == "translate":
+                reach += vec
+            elif typ == "zoom":
+                reach = vec + math.exp(real) * (reach + vec)
+            elif typ == "stretch":
+                reach = vec + vec * (reach + vec)
+
+        elif typ in settings.BLUR_LAYER:
+            extent = get_node_extent(params["size"], defs)
+            if extent is None:
+                return None
+            reach += 3 * extent[0]
+
+        elif typ in set.union(settings.SHAPE_SOLID_LAYER, settings.IMAGE_LAYER, {"simple_circle"}):
+            extent = get_shape_extent(params, defs)
+            if extent is None:
+                return None
+            reach = max(reach, extent)
+
+        elif typ in set.union(settings.SOLID_LAYER, {"linear_gradient", "radial_gradient"}):
+            # These fill the whole pre-composition, which is only known to cover
+            # the canvas when it is not transformed
+            if nested:
+                return None
+            fills = True
+        # Other layers are not exported
+
+        needed = max(needed, reach)
+    return reach, needed
+
+
+def set_precomp_size(root):
+    """
+    Sets the increase in the size of pre-compositions, so that they hold their
+    content over all the frames. Without a bound for the content, the size is
+    increased by settings.MAX_PRECOMP_INFLATION times the canvas size
+
+    Args:
+        root (lxml.etree._Element) : Synfig format root canvas
+
+    Returns:
+        (None)
+    """
+    width = settings.MAX_PRECOMP_INFLATION * settings.lottie_format["w"]
+    height = settings.MAX_PRECOMP_INFLATION * settings.lottie_format["h"]
+    defs = {}
+    for node in root.iter("defs"):
+        for child in node:
+            defs[child.attrib["id"]] = child
+    extent = get_canvas_extent(root, defs)
+    if extent is not None:
+        radius = extent[1] * settings.PIX_PER_UNIT
+        width = min(width, 2 * math.ceil(max(0, radius - settings.lottie_format["w"] / 2)))
+        height = min(height, 2 * math.ceil(max(0, radius - settings.lottie_format["h"] / 2)))
+    settings.ADDITIONAL_PRECOMP_WIDTH = width
+    settings.ADDITIONAL_PRECOMP_HEIGHT = height
+
+
 def get_offset():
     """
     Computes the offset by which the layers need to be moved with
@@ -0,0 +1,65 @@
+# pylint: disable=line-too-long
+"""
+Tests that the gamma correction of common/misc.py gives the same floats as
+applying the gamma with **
+
+usage   : python3 -m unittest discover tests (from the plugin directory)
+"""
+
+import os
+import sys
+import random
+import unittest
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import settings
+from common.misc import gamma_correct, reverse_gamma_correct, clamp_col
+
+GAMMAS = [1.0, 2.2, 1.8, 2.4, 0.5, 1/2.2]
+
+
+class TestGamma(unittest.TestCase):
+    """
+    Color values of the edges, of 8 bit colors and random ones, for each gamma
+    """
+    def setUp(self):
+        settings.init()
+        rand = random.Random(0)
+        self.values = [0.0, 1.0, 0.5] + [i / 255 for i in range(256)]
+        self.values += [rand.random() for _ in range(2000)]
+
+    def tearDown(self):
+        settings.GAMMA = [2.2, 2.2, 2.2]
+
+    def set_gamma(self, gamma):
+        settings.GAMMA = [gamma, gamma, gamma]
+        settings.gamma_exponents = [1/gamma for gamma in settings.GAMMA]
+
+    def test_gamma_correct(self):
+        for gamma in GAMMAS:
+            self.set_gamma(gamma)
+            for channel in range(3):
+                for color in self.values:
+                    self.assertEqual(gamma_correct(color, channel), color ** (1/gamma))
+
+    def test_reverse_gamma_correct(self):
+        for gamma in GAMMAS:
+            self.set_gamma(gamma)
+            for channel in range(3):
+                for color in self.values:
+                    self.assertEqual(reverse_gamma_correct(color, channel), color ** gamma)
+
+    def test_clamp_col(self):
+        for gamma in GAMMAS:
+            self.set_gamma(gamma)
+            for color in self.values + [-0.0, 1.5]:
+                self.assertEqual(clamp_col(color, 0), max(0, min(int(color ** (1/gamma) * 255), 255)))
+
+    def test_channels(self):
+        settings.GAMMA = [1.0, 2.2, 1.8]
+        settings.gamma_exponents = [1/gamma for gamma in settings.GAMMA]
+        self.assertEqual([gamma_correct(0.3, channel) for channel in range(3)], [0.3, 0.3 ** (1/2.2), 0.3 ** (1/1.8)])
+
+
+if __name__ == "__main__":
+    unittest.main()
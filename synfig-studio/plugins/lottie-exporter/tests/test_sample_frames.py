@@ -0,0 +1,40 @@
+# pylint: disable=line-too-long
+"""
+Tests for the sampling of frames in properties/shapePropKeyframe/helper.py
+
+usage   : python3 -m unittest discover tests (from the plugin directory)
+"""
+
+import os
+import sys
+import unittest
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import settings
+from properties.shapePropKeyframe.helper import sample_frames
+
+
+class TestSampleFrames(unittest.TestCase):
+    """
+    Frames are sampled from the first to the last one, in steps of 1
+    """
+    def setUp(self):
+        settings.init()
+
+    def test_int_window(self):
+        settings.JOBS = 1
+        self.assertEqual(sample_frames(lambda fr: fr * 2, 3, 6), [6, 8, 10, 12])
+
+    def test_float_window(self):
+        # Windows set by activepoints or linear converts hold floats
+        settings.JOBS = 1
+        self.assertEqual(sample_frames(lambda fr: fr, 12.0, 15.0), [12.0, 13.0, 14.0, 15.0])
+        self.assertEqual(sample_frames(lambda fr: fr, 0.5, 3.0), [0.5, 1.5, 2.5])
+
+    def test_float_window_jobs(self):
+        settings.JOBS = 2
+        self.assertEqual(sample_frames(lambda fr: fr, 2.0, 41.0), [float(fr) for fr in range(2, 42)])
+
+
+if __name__ == "__main__":
+    unittest.main()